@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
 from typing import Any
 
 import jwt
 
 logger = logging.getLogger(__name__)
 
+# Verified payloads keyed by a hash of (secret, token), with the token's expiry.
+_TOKEN_CACHE_SIZE = 4096
+_TOKEN_CACHE: OrderedDict[bytes, tuple[dict[str, Any], int]] = OrderedDict()
+
 
 class TokenExpiredError(Exception):
     """Raised when a JWT token has expired."""
@@ -20,26 +27,104 @@ class TokenInvalidError(Exception):
     """Raised when a JWT token is invalid."""
 
 
+# HS256 signs and verifies with the shared KAIRN_JWT_SECRET. EdDSA signs with the
+# Ed25519 PEM in KAIRN_JWT_PRIVATE_KEY and verifies with the matching public key
+# in KAIRN_JWT_PUBLIC_KEY, so verifiers never hold signing material. EdDSA needs
+# the `cryptography` package.
+SUPPORTED_ALGORITHMS = ("HS256", "EdDSA")
+
+
+def _load_signing_config() -> tuple[str, str | None, str | None]:
+    algorithm = os.environ.get("KAIRN_JWT_ALG", "HS256")
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported KAIRN_JWT_ALG: {algorithm}")
+    if algorithm == "EdDSA":
+        return (
+            algorithm,
+            os.environ.get("KAIRN_JWT_PRIVATE_KEY"),
+            os.environ.get("KAIRN_JWT_PUBLIC_KEY"),
+        )
+    secret = os.environ.get("KAIRN_JWT_SECRET", "test-secret-key-do-not-use")
+    return algorithm, secret, secret
+
+
+_ALGORITHM, _SIGNING_KEY, _VERIFYING_KEY = _load_signing_config()
+
+
+def refresh_secret() -> None:
+    """Re-read the JWT algorithm and keys, e.g. after a key rotation."""
+    global _ALGORITHM, _SIGNING_KEY, _VERIFYING_KEY
+    _ALGORITHM, _SIGNING_KEY, _VERIFYING_KEY = _load_signing_config()
+    _TOKEN_CACHE.clear()
+
+
+def verification_key() -> str | None:
+    """Key to pass to verify_token: the HS256 secret or the EdDSA public key."""
+    return _VERIFYING_KEY
+
+
+@functools.lru_cache(maxsize=8)
+def _prepared_key(algorithm: str, key: str) -> Any:
+    """Parse a key once; PyJWT would otherwise re-parse PEM keys on every call."""
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(key)
+
+
 def create_token(user_id: str, org_id: str, exp_minutes: int = 60) -> str:
     """Create a JWT token for a user."""
-    secret = os.environ.get("KAIRN_JWT_SECRET", "test-secret-key-do-not-use")
-    now = int(time.time())
+    if _SIGNING_KEY is None:
+        raise RuntimeError("KAIRN_JWT_PRIVATE_KEY must be set to sign EdDSA tokens")
+    now = time.time_ns() // 1_000_000_000
     payload = {
         "sub": user_id,
         "org": org_id,
         "exp": now + (exp_minutes * 60),
     }
-    return jwt.encode(payload, secret, algorithm="HS256")
+    return jwt.encode(payload, _prepared_key(_ALGORITHM, _SIGNING_KEY), algorithm=_ALGORITHM)
+
+
+def _cache_key(token: str, secret: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_ALGORITHM.encode())
+    h.update(b"\0")
+    h.update(secret.encode())
+    h.update(b"\0")
+    h.update(token.encode())
+    return h.digest()
 
 
 def verify_token(token: str, secret: str) -> dict[str, Any]:
-    """Verify and decode a JWT token."""
+    """Verify and decode a JWT token.
+
+    ``secret`` is the shared secret for HS256, or the PEM public key for EdDSA.
+
+    Successfully verified tokens are cached until they expire, so a session
+    presenting the same token repeatedly skips the HMAC check and JSON decode.
+    """
+    key = _cache_key(token, secret)
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        payload, exp = cached
+        if time.time() < exp:
+            _TOKEN_CACHE.move_to_end(key)
+            return dict(payload)
+        del _TOKEN_CACHE[key]
+
     try:
-        payload = jwt.decode(token, secret, algorithms=["HS256"])
-        return payload
+        payload = jwt.decode(
+            token,
+            _prepared_key(_ALGORITHM, secret),
+            algorithms=[_ALGORITHM],
+            options={"require": ["exp"]},
+        )
     except jwt.ExpiredSignatureError as e:
         logger.warning("Token expired: %s", e)
         raise TokenExpiredError("Token has expired") from e
-    except jwt.InvalidTokenError as e:
+    except jwt.PyJWTError as e:
+        # Also covers InvalidKeyError when the verification key is malformed
         logger.warning("Invalid token: %s", e)
         raise TokenInvalidError("Token is invalid") from e
+
+    _TOKEN_CACHE[key] = (payload, int(payload["exp"]))
+    if len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+        _TOKEN_CACHE.popitem(last=False)
+    return dict(payload)
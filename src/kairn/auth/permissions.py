@@ -9,26 +9,34 @@ _ROLE_HIERARCHY = {
     "reader": 1,
 }
 
+# Every (role, required_role) pair that is granted, so checks are a single set lookup.
+_ALLOWED = frozenset(
+    (role, required)
+    for role, level in _ROLE_HIERARCHY.items()
+    for required, required_level in _ROLE_HIERARCHY.items()
+    if level >= required_level
+)
+
+_READ_ROLES = frozenset(role for role, required in _ALLOWED if required == "reader")
+_WRITE_ROLES = frozenset(role for role, required in _ALLOWED if required == "contributor")
+_ADMIN_ROLES = frozenset(role for role, required in _ALLOWED if required == "maintainer")
+
 
 def check_permission(role: str, required_role: str) -> bool:
     """Check if a role has permission to perform an action requiring a specific role."""
-    if role not in _ROLE_HIERARCHY or required_role not in _ROLE_HIERARCHY:
-        return False
-    role_level = _ROLE_HIERARCHY[role]
-    required_level = _ROLE_HIERARCHY[required_role]
-    return role_level >= required_level
+    return (role, required_role) in _ALLOWED
 
 
 def can_read(role: str) -> bool:
     """Check if a role can read workspace content."""
-    return check_permission(role, "reader")
+    return role in _READ_ROLES
 
 
 def can_write(role: str) -> bool:
     """Check if a role can write to workspace content."""
-    return check_permission(role, "contributor")
+    return role in _WRITE_ROLES
 
 
 def can_admin(role: str) -> bool:
     """Check if a role can perform administrative actions."""
-    return check_permission(role, "maintainer")
+    return role in _ADMIN_ROLES
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
+import math
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, Any], ...]:
+    """Parse a config.yaml once per (path, mtime, size); any edit misses the cache.
+
+    The parsed values are shared between callers and must be treated as read-only;
+    Config.load converts each one through its field's type before storing it.
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}
+    return tuple(data.items())
+
 
 @dataclass
 class Config:
@@ -37,6 +59,9 @@ class Config:
     confidence_multiplier_medium: float = 2.0
     confidence_multiplier_low: float = 4.0
 
+    _decay_rates: dict[str, float] = field(init=False, repr=False, compare=False)
+    _confidence_multipliers: dict[str, float] = field(init=False, repr=False, compare=False)
+
     @classmethod
     def load(cls, workspace_path: Path | None = None) -> Config:
         """Load config from YAML file, env vars, then defaults."""
@@ -56,16 +81,21 @@ class Config:
 
         # Load YAML config if exists
         config_file = config.workspace_path / "config.yaml"
-        if config_file.exists():
-            with open(config_file) as f:
-                data = yaml.safe_load(f) or {}
-            for key, value in data.items():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is not None:
+            items = _read_config_file(str(config_file), stat.st_mtime_ns, stat.st_size)
+            for key, value in items:
                 if hasattr(config, key):
                     expected_type = type(getattr(config, key))
                     if expected_type is Path:
                         setattr(config, key, Path(value))
                     else:
                         setattr(config, key, expected_type(value))
+            # YAML may override the half-lives and multipliers
+            config._rebuild_rate_tables()
 
         return config
 
@@ -80,10 +110,10 @@ class Config:
     def workspace_db_path(self, workspace_id: str) -> Path:
         return self.workspaces_dir / f"ws_{workspace_id}.db"
 
-    def decay_rate_for_type(self, experience_type: str) -> float:
-        """Convert half-life to decay rate: rate = ln(2) / half_life."""
-        import math
+    def __post_init__(self) -> None:
+        self._rebuild_rate_tables()
 
+    def _rebuild_rate_tables(self) -> None:
         half_lives = {
             "solution": self.decay_solution,
             "pattern": self.decay_pattern,
@@ -91,17 +121,24 @@ class Config:
             "workaround": self.decay_workaround,
             "gotcha": self.decay_gotcha,
         }
-        half_life = half_lives.get(experience_type, self.decay_solution)
-        return math.log(2) / half_life
-
-    def confidence_multiplier(self, confidence: str) -> float:
-        """Get decay multiplier for confidence level."""
-        multipliers = {
+        self._decay_rates = {
+            type_: math.log(2) / half_life for type_, half_life in half_lives.items()
+        }
+        self._confidence_multipliers = {
             "high": self.confidence_multiplier_high,
             "medium": self.confidence_multiplier_medium,
             "low": self.confidence_multiplier_low,
         }
-        return multipliers.get(confidence, self.confidence_multiplier_high)
+
+    def decay_rate_for_type(self, experience_type: str) -> float:
+        """Convert half-life to decay rate: rate = ln(2) / half_life."""
+        rates = self._decay_rates
+        return rates.get(experience_type, rates["solution"])
+
+    def confidence_multiplier(self, confidence: str) -> float:
+        """Get decay multiplier for confidence level."""
+        multipliers = self._confidence_multipliers
+        return multipliers.get(confidence, multipliers["high"])
 
     def save(self) -> None:
         """Save current config to YAML."""
@@ -117,4 +154,4 @@ class Config:
             "wal_mode": self.wal_mode,
         }
         with open(config_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False)
@@ -5,9 +5,9 @@ and confidence multipliers. Automatically promotes frequently accessed experienc
 to the knowledge graph.
 """
 
+import asyncio
 import logging
 import math
-from datetime import UTC, datetime
 
 from kairn.events.bus import EventBus
 from kairn.events.types import EventType
@@ -33,6 +33,13 @@ CONFIDENCE_MULTIPLIERS: dict[str, float] = {
     "low": 4.0,  # 4x faster decay
 }
 
+# Decay rate for every (type, confidence) pair, so save() does a single lookup
+_DECAY_RATES: dict[tuple[str, str], float] = {
+    (type_, confidence): math.log(2) * multiplier / half_life
+    for type_, half_life in HALF_LIVES.items()
+    for confidence, multiplier in CONFIDENCE_MULTIPLIERS.items()
+}
+
 
 def decay_rate_from_half_life(half_life_days: float) -> float:
     """Convert half-life to decay rate: rate = ln(2) / half_life.
@@ -98,9 +105,7 @@ class ExperienceEngine:
             )
 
         # Calculate decay_rate
-        half_life = HALF_LIVES[type]
-        multiplier = CONFIDENCE_MULTIPLIERS[confidence]
-        decay_rate = math.log(2) * multiplier / half_life
+        decay_rate = _DECAY_RATES[type, confidence]
 
         # Create experience
         exp = Experience(
@@ -152,6 +157,7 @@ class ExperienceEngine:
         min_relevance: float = 0.0,
         limit: int = 10,
         offset: int = 0,
+        content_max_len: int | None = None,
     ) -> list[Experience]:
         """Search for experiences.
 
@@ -161,34 +167,21 @@ class ExperienceEngine:
             min_relevance: Minimum relevance threshold
             limit: Maximum number of results
             offset: Offset for pagination
+            content_max_len: Truncate content to this many characters in SQL
 
         Returns:
             List of matching experiences, sorted by relevance descending
         """
-        # Query from store
         results = await self.store.query_experiences(
             text=text,
             exp_type=exp_type,
-            limit=100000,  # Get all first, filter by relevance
-            offset=0,
+            min_relevance=min_relevance,
+            order_by_relevance=True,
+            limit=limit,
+            offset=offset,
+            content_max_len=content_max_len,
         )
-
-        # Convert to Experience objects and calculate current relevance
-        now = datetime.now(UTC)
-        experiences = []
-        for data in results:
-            exp = Experience(**data)
-            current_relevance = exp.relevance(at=now)
-
-            # Apply min_relevance filter
-            if current_relevance >= min_relevance:
-                experiences.append(exp)
-
-        # Sort by relevance descending
-        experiences.sort(key=lambda e: e.relevance(at=now), reverse=True)
-
-        # Apply pagination
-        return experiences[offset : offset + limit]
+        return [Experience(**data) for data in results]
 
     async def access(self, exp_id: str) -> Experience | None:
         """Access an experience (increments access count and checks for promotion).
@@ -199,13 +192,12 @@ class ExperienceEngine:
         Returns:
             Updated Experience if found, None otherwise
         """
-        # Increment access count
-        await self.store.increment_access_count(exp_id)
-
-        # Get updated experience
-        exp = await self.get(exp_id)
-        if exp is None:
+        # Increment access count; the returned row already carries the trigger's
+        # needs_promotion flag, so no separate fetch or promotable scan is needed
+        data = await self.store.increment_access_count(exp_id)
+        if data is None:
             return None
+        exp = Experience(**data)
 
         # Emit access event
         await self.event_bus.emit(
@@ -218,15 +210,12 @@ class ExperienceEngine:
 
         logger.info(f"Accessed experience {exp.id} (count={exp.access_count})")
 
-        # Check for promotion
-        if exp.promoted_to_node_id is None:
-            # Check if needs promotion (flagged by trigger)
-            promotable = await self.get_promotable()
-            if any(p.id == exp.id for p in promotable):
-                node = await self._promote(exp)
-                if node:
-                    # Refresh experience to get updated promoted_to_node_id
-                    exp = await self.get(exp_id)
+        # Check for promotion (flagged by trigger)
+        if exp.promoted_to_node_id is None and (exp.properties or {}).get("needs_promotion") == 1:
+            node = await self._promote(exp)
+            if node:
+                # Refresh experience to get updated promoted_to_node_id
+                exp = await self.get(exp_id)
 
         return exp
 
@@ -239,31 +228,24 @@ class ExperienceEngine:
         Returns:
             List of pruned experience IDs
         """
-        # Find all experiences below threshold
-        now = datetime.now(UTC)
-        all_experiences = await self.store.query_experiences(limit=100000, offset=0)
+        expired = await self.store.get_expired_experiences(threshold)
 
         pruned_ids = []
-        for data in all_experiences:
-            exp = Experience(**data)
-            current_relevance = exp.relevance(at=now)
-            if current_relevance < threshold:
-                # Archive before deleting (log)
-                logger.info(
-                    f"Pruning experience {exp.id} "
-                    f"(relevance={exp.relevance(at=now):.4f}, threshold={threshold})"
-                )
-
-                # Delete from store
-                await self.store.delete_experience(exp.id)
-
-                # Emit event
-                await self.event_bus.emit(
-                    EventType.EXPERIENCE_PRUNED,
-                    {"exp_id": exp.id},
+        for row in expired:
+            logger.info(
+                f"Pruning experience {row['id']} "
+                f"(relevance={row['relevance']:.4f}, threshold={threshold})"
+            )
+            pruned_ids.append(row["id"])
+
+        if pruned_ids:
+            await self.store.delete_experiences(pruned_ids)
+            await asyncio.gather(
+                *(
+                    self.event_bus.emit(EventType.EXPERIENCE_PRUNED, {"exp_id": exp_id})
+                    for exp_id in pruned_ids
                 )
-
-                pruned_ids.append(exp.id)
+            )
 
         logger.info(f"Pruned {len(pruned_ids)} experiences")
         return pruned_ids
@@ -16,6 +16,13 @@ from kairn.storage.base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9_-]+")
+_STOP_WORDS = frozenset(
+    {"the", "a", "an", "is", "are", "in", "for", "on", "with", "and", "or", "of", "to"}
+)
+# Bounds the auto-link FTS5 query for nodes with long descriptions.
+_AUTO_LINK_MAX_KEYWORDS = 8
+
 
 class GraphEngine:
     """Knowledge graph operations over the storage backend."""
@@ -52,6 +59,18 @@ class GraphEngine:
         await self.bus.emit(EventType.NODE_CREATED, {"node_id": node.id, "name": node.name})
         return node
 
+    async def add_nodes_bulk(self, specs: list[dict[str, Any]]) -> list[Node]:
+        """Create many nodes in a single transaction.
+
+        Each spec takes the keyword arguments of ``add_node``. Bulk inserts
+        skip FTS5 auto-linking; a NODE_CREATED event is still emitted per node.
+        """
+        nodes = [Node(**spec) for spec in specs]
+        await self.store.insert_nodes([node.to_storage() for node in nodes])
+        for node in nodes:
+            await self.bus.emit(EventType.NODE_CREATED, {"node_id": node.id, "name": node.name})
+        return nodes
+
     async def get_node(self, node_id: str) -> Node | None:
         data = await self.store.get_node(node_id)
         if not data:
@@ -156,29 +175,31 @@ class GraphEngine:
         self, node_id: str, *, depth: int = 1, edge_type: str | None = None
     ) -> list[dict[str, Any]]:
         """BFS traversal from a node, returning connected nodes up to depth."""
-        visited: set[str] = set()
+        visited = {node_id}
         results: list[dict[str, Any]] = []
-        queue: list[tuple[str, int]] = [(node_id, 0)]
-
-        while queue:
-            current_id, current_depth = queue.pop(0)
-            if current_id in visited or current_depth > depth:
-                continue
-            visited.add(current_id)
-
-            if current_id != node_id:
-                node = await self.get_node(current_id)
-                if node:
-                    results.append({"node": node.to_response(), "depth": current_depth})
-
-            if current_depth < depth:
-                edges = await self.store.get_edges(source_id=current_id, edge_type=edge_type)
-                edges += await self.store.get_edges(target_id=current_id, edge_type=edge_type)
-                for edge in edges:
-                    src = edge["source_id"]
-                    neighbor = edge["target_id"] if src == current_id else src
-                    if neighbor not in visited:
-                        queue.append((neighbor, current_depth + 1))
+        frontier = [node_id]
+
+        for current_depth in range(1, depth + 1):
+            edges = await self.store.get_incident_edges(frontier, edge_type=edge_type)
+            in_frontier = set(frontier)
+            next_frontier: list[str] = []
+            for edge in edges:
+                for end, other in (("source_id", "target_id"), ("target_id", "source_id")):
+                    neighbor = edge[other]
+                    if edge[end] in in_frontier and neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+
+            rows = {row["id"]: row for row in await self.store.get_nodes(next_frontier)}
+            results.extend(
+                {"node": Node(**rows[neighbor]).to_response(), "depth": current_depth}
+                for neighbor in next_frontier
+                if neighbor in rows
+            )
+
+            if not next_frontier:
+                break
+            frontier = next_frontier
 
         return results
 
@@ -188,23 +209,9 @@ class GraphEngine:
     async def _auto_link(self, node: Node) -> None:
         """Find related nodes via FTS5 and create edges."""
         search_text = f"{node.name} {node.description or ''}"
-        words = re.findall(r"[a-zA-Z0-9_-]+", search_text.lower())
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "in",
-            "for",
-            "on",
-            "with",
-            "and",
-            "or",
-            "of",
-            "to",
-        }
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
+        words = _TOKEN_RE.findall(search_text.lower())
+        keywords = list(dict.fromkeys(w for w in words if w not in _STOP_WORDS and len(w) > 2))
+        keywords = keywords[:_AUTO_LINK_MAX_KEYWORDS]
         if not keywords:
             return
         fts_query = " OR ".join(keywords)
@@ -215,15 +222,14 @@ class GraphEngine:
             logger.warning("FTS5 auto-link search failed for %s: %s", node.id, exc)
             return
 
-        for row in related:
-            if row["id"] != node.id:
-                try:
-                    edge = Edge(
-                        source_id=node.id,
-                        target_id=row["id"],
-                        type="auto_related",
-                        weight=0.5,
-                    )
-                    await self.store.insert_edge(edge.to_storage())
-                except (OSError, RuntimeError, sqlite3.IntegrityError):
-                    logger.debug("Auto-link edge skipped: %s → %s", node.id, row["id"])
+        edges = [
+            Edge(source_id=node.id, target_id=row["id"], type="auto_related", weight=0.5)
+            for row in related
+            if row["id"] != node.id
+        ]
+        if not edges:
+            return
+        try:
+            await self.store.insert_edges([edge.to_storage() for edge in edges])
+        except (OSError, RuntimeError, sqlite3.IntegrityError) as exc:
+            logger.debug("Auto-link edges skipped for %s: %s", node.id, exc)
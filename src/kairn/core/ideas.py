@@ -17,15 +17,22 @@ from kairn.storage.base import StorageBackend
 logger = logging.getLogger(__name__)
 
 # Valid status transitions
-VALID_TRANSITIONS: dict[str, set[str]] = {
-    "draft": {"evaluating"},
-    "evaluating": {"approved", "archived"},
-    "approved": {"implementing", "archived"},
-    "implementing": {"done", "archived"},
-    "done": {"archived"},
-    "archived": {"draft"},
+VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    "draft": frozenset({"evaluating"}),
+    "evaluating": frozenset({"approved", "archived"}),
+    "approved": frozenset({"implementing", "archived"}),
+    "implementing": frozenset({"done", "archived"}),
+    "done": frozenset({"archived"}),
+    "archived": frozenset({"draft"}),
 }
 
+# (from, to) pairs, so validation is a single set lookup
+_ALLOWED_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (from_status, to_status)
+    for from_status, targets in VALID_TRANSITIONS.items()
+    for to_status in targets
+)
+
 # Happy path for advance()
 ADVANCE_PATH: dict[str, str] = {
     "draft": "evaluating",
@@ -147,11 +154,9 @@ class IdeaEngine:
                 changed_fields.append(key)
 
         # Update the idea
-        updates["updated_at"] = datetime.now(UTC)
-        await self._store.update_idea(idea_id, updates)
-
-        # Get updated idea
-        updated = await self.get(idea_id)
+        updates["updated_at"] = datetime.now(UTC).isoformat()
+        updated_data = await self._store.update_idea(idea_id, updates)
+        updated = Idea(**updated_data) if updated_data else None
 
         if updated and changed_fields:
             logger.info(f"Updated idea {idea_id}: {', '.join(changed_fields)}")
@@ -217,15 +222,16 @@ class IdeaEngine:
             logger.warning(f"Cannot link: idea {idea_id} not found")
             return None
 
+        # Look up the target node and the idea's own graph node in one query
+        existing_nodes = {row["id"] for row in await self._store.get_nodes([node_id, idea_id])}
+
         # Verify target node exists
-        target_data = await self._store.get_node(node_id)
-        if target_data is None:
+        if node_id not in existing_nodes:
             logger.warning(f"Cannot link: node {node_id} not found")
             return None
 
         # Create/ensure idea node exists in graph
-        idea_node_data = await self._store.get_node(idea_id)
-        if idea_node_data is None:
+        if idea_id not in existing_nodes:
             # Create a node for the idea
             idea_node = Node(
                 id=idea_id,
@@ -285,9 +291,8 @@ class IdeaEngine:
         Raises:
             ValueError: If transition is not valid
         """
-        allowed_targets = VALID_TRANSITIONS.get(from_status, set())
-        if to_status not in allowed_targets:
+        if (from_status, to_status) not in _ALLOWED_PAIRS:
             raise ValueError(
                 f"Invalid status transition from '{from_status}' to '{to_status}'. "
-                f"Allowed transitions: {sorted(allowed_targets)}"
+                f"Allowed transitions: {sorted(VALID_TRANSITIONS.get(from_status, ()))}"
             )
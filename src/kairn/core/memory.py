@@ -1,7 +1,8 @@
 """Project Memory engine for lifecycle and progress tracking."""
 
 import logging
-from typing import ClassVar
+from collections import Counter
+from typing import Any, ClassVar
 
 from kairn.events.bus import EventBus
 from kairn.events.types import EventType
@@ -15,13 +16,20 @@ class ProjectMemory:
     """Manages project lifecycle and progress logging."""
 
     # Phase transition rules: from_phase → allowed_to_phases
-    _PHASE_TRANSITIONS: ClassVar[dict[str, set[str]]] = {
-        "planning": {"active"},
-        "active": {"paused", "done"},
-        "paused": {"active", "done"},
-        "done": set(),  # Final state
+    _PHASE_TRANSITIONS: ClassVar[dict[str, frozenset[str]]] = {
+        "planning": frozenset({"active"}),
+        "active": frozenset({"paused", "done"}),
+        "paused": frozenset({"active", "done"}),
+        "done": frozenset(),  # Final state
     }
 
+    # (from, to) pairs, including same-phase no-ops, for single-lookup validation
+    _ALLOWED_TRANSITIONS: ClassVar[frozenset[tuple[str, str]]] = frozenset(
+        (from_phase, to_phase)
+        for from_phase, targets in _PHASE_TRANSITIONS.items()
+        for to_phase in targets
+    ) | frozenset((phase, phase) for phase in VALID_PHASES)
+
     def __init__(self, store: StorageBackend, event_bus: EventBus) -> None:
         """Initialize ProjectMemory.
 
@@ -104,12 +112,13 @@ class ProjectMemory:
         Raises:
             ValueError: If phase transition is invalid or phase value is invalid
         """
-        current = await self.get_project(project_id)
-        if not current:
-            return None
-
-        # Validate phase transition if phase is being updated
+        # Validate phase transition if phase is being updated; other updates go
+        # straight to the store, which returns None for an unknown project
         if "phase" in updates:
+            current = await self.get_project(project_id)
+            if not current:
+                return None
+
             new_phase = updates["phase"]
 
             # Validate phase value
@@ -169,6 +178,30 @@ class ProjectMemory:
 
         return True
 
+    async def set_active_and_list(
+        self, project_id: str, *, active_only: bool = False
+    ) -> tuple[bool, list[Project]]:
+        """Activate a project and list projects in a single storage transaction.
+
+        Args:
+            project_id: Project identifier to activate
+            active_only: If True, list only active projects
+
+        Returns:
+            Tuple of (activated, projects); activated is False if project not found
+        """
+        found, projects_data = await self._store.set_active_and_list_projects(
+            project_id, active_only=active_only
+        )
+        if found:
+            logger.info("Activated project: id=%s", project_id)
+            await self._event_bus.emit(
+                EventType.PROJECT_ACTIVATED,
+                {"project_id": project_id},
+            )
+
+        return found, [Project(**data) for data in projects_data]
+
     async def log_progress(
         self,
         *,
@@ -243,6 +276,40 @@ class ProjectMemory:
 
         return entry
 
+    async def log_progress_bulk(
+        self, project_id: str, entries: list[dict[str, Any]]
+    ) -> list[ProgressEntry]:
+        """Log many progress/failure entries for a project in a single transaction.
+
+        Emits one PROGRESS_LOGGED_BATCH event with per-type counts rather than a
+        PROGRESS_LOGGED event per entry.
+
+        Args:
+            project_id: Project identifier
+            entries: Dicts with ``action`` and optional ``type`` ("progress" by
+                default or "failure"), ``result`` and ``next_step``
+
+        Returns:
+            Created ProgressEntry instances, in input order
+        """
+        logged = [
+            ProgressEntry(project_id=project_id, **{"type": "progress", **entry})
+            for entry in entries
+        ]
+        await self._store.insert_progress_many([entry.to_storage() for entry in logged])
+        logger.info("Logged %d progress entries for project %s", len(logged), project_id)
+
+        await self._event_bus.emit(
+            EventType.PROGRESS_LOGGED_BATCH,
+            {
+                "project_id": project_id,
+                "count": len(logged),
+                "types": dict(Counter(entry.type for entry in logged)),
+            },
+        )
+
+        return logged
+
     async def get_progress(
         self,
         project_id: str,
@@ -277,9 +344,4 @@ class ProjectMemory:
         Returns:
             True if transition is allowed, False otherwise
         """
-        # Same phase is always allowed (no-op)
-        if from_phase == to_phase:
-            return True
-
-        allowed_transitions = self._PHASE_TRANSITIONS.get(from_phase, set())
-        return to_phase in allowed_transitions
+        return (from_phase, to_phase) in self._ALLOWED_TRANSITIONS
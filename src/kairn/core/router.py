@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from typing import Any
@@ -37,14 +36,7 @@ class ContextRouter:
         for route in routes:
             if route["confidence"] < min_confidence:
                 continue
-            node_ids = route["node_ids"]
-            if isinstance(node_ids, str):
-                try:
-                    node_ids = json.loads(node_ids)
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning("Corrupted node_ids in route: %s", route.get("keyword"))
-                    continue
-            for nid in node_ids:
+            for nid in route["node_ids"]:
                 node_scores[nid] = max(node_scores.get(nid, 0), route["confidence"])
 
         sorted_ids = sorted(node_scores, key=lambda nid: node_scores[nid], reverse=True)[:limit]
@@ -72,22 +64,19 @@ class ContextRouter:
         text = f"{name} {description or ''}"
         keywords = self._extract_keywords(text)
 
+        existing = {r["keyword"]: r for r in await self.store.get_routes(keywords)}
+        changed: list[tuple[str, list[str], float]] = []
         for keyword in keywords:
-            existing = await self.store.get_routes([keyword])
-            if existing:
-                route = existing[0]
+            route = existing.get(keyword)
+            if route:
                 node_ids = route["node_ids"]
-                if isinstance(node_ids, str):
-                    try:
-                        node_ids = json.loads(node_ids)
-                    except (json.JSONDecodeError, TypeError):
-                        logger.warning("Corrupted node_ids in route for keyword: %s", keyword)
-                        continue
                 if node_id not in node_ids:
                     node_ids.append(node_id)
-                    await self.store.upsert_route(keyword, node_ids, route["confidence"])
+                    changed.append((keyword, node_ids, route["confidence"]))
             else:
-                await self.store.upsert_route(keyword, [node_id], 0.5)
+                changed.append((keyword, [node_id], 0.5))
+        if changed:
+            await self.store.upsert_routes(changed)
 
         await self.bus.emit(EventType.ROUTE_UPDATED, {"node_id": node_id, "keywords": keywords})
 
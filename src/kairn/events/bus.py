@@ -37,8 +37,11 @@ class EventBus:
 
     async def emit(self, event_type: EventType, data: dict[str, Any] | None = None) -> None:
         """Emit an event to all registered listeners."""
+        specific = self._listeners.get(event_type)
+        if not specific and not self._global_listeners:
+            return
         data = data or {}
-        listeners = self._listeners.get(event_type, []) + self._global_listeners
+        listeners = (specific or []) + self._global_listeners
 
         for listener in listeners:
             try:
@@ -22,6 +22,7 @@ class EventType(StrEnum):
     PROJECT_ACTIVATED = "project.activated"
 
     PROGRESS_LOGGED = "progress.logged"
+    PROGRESS_LOGGED_BATCH = "progress.logged_batch"
 
     IDEA_CREATED = "idea.created"
     IDEA_UPDATED = "idea.updated"
@@ -19,7 +19,7 @@ class Edge(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self) -> dict:
         return {
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import math
+import time
 import uuid
 from datetime import UTC, datetime
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
-VALID_TYPES = {"solution", "pattern", "decision", "workaround", "gotcha"}
-VALID_CONFIDENCES = {"high", "medium", "low"}
+VALID_TYPES = frozenset({"solution", "pattern", "decision", "workaround", "gotcha"})
+VALID_CONFIDENCES = frozenset({"high", "medium", "low"})
 
 
 class Experience(BaseModel):
@@ -30,20 +32,32 @@ class Experience(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
     last_accessed: str | None = None
 
-    def relevance(self, *, at: datetime | None = None) -> float:
-        """Calculate current relevance using exponential decay."""
-        at = at or datetime.now(UTC)
+    @cached_property
+    def created_at_ts(self) -> float:
+        """created_at as a POSIX timestamp, parsed once per instance (naive means UTC)."""
         created = datetime.fromisoformat(self.created_at)
         if created.tzinfo is None:
             created = created.replace(tzinfo=UTC)
-        days = (at - created).total_seconds() / 86400
+        return created.timestamp()
+
+    def relevance(self, *, at: datetime | float | None = None) -> float:
+        """Calculate current relevance using exponential decay.
+
+        ``at`` may be a datetime or a POSIX timestamp; pass one computed once when
+        scoring many experiences.
+        """
+        if at is None:
+            at = time.time()
+        elif isinstance(at, datetime):
+            at = at.timestamp()
+        days = (at - self.created_at_ts) / 86400
         return self.score * math.exp(-self.decay_rate * days)
 
     def is_expired(self, threshold: float = 0.01) -> bool:
         return self.relevance() < threshold
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self, *, detail: str = "summary") -> dict:
         data = {
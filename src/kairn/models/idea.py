@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
-VALID_STATUSES = {"draft", "evaluating", "approved", "implementing", "done", "archived"}
+VALID_STATUSES = frozenset({"draft", "evaluating", "approved", "implementing", "done", "archived"})
 
 
 class Idea(BaseModel):
@@ -25,7 +25,7 @@ class Idea(BaseModel):
     updated_at: str | None = None
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self, *, detail: str = "summary") -> dict:
         data = {
@@ -28,7 +28,7 @@ class Node(BaseModel):
     deleted_at: str | None = None
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self, *, detail: str = "summary") -> dict[str, Any]:
         data: dict[str, Any] = {"_v": "1.0", "id": self.id, "name": self.name, "type": self.type}
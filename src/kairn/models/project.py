@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
-VALID_PHASES = {"planning", "active", "paused", "done"}
+VALID_PHASES = frozenset({"planning", "active", "paused", "done"})
 
 
 class Project(BaseModel):
@@ -25,7 +25,7 @@ class Project(BaseModel):
     updated_at: str | None = None
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self, *, detail: str = "summary") -> dict:
         data = {
@@ -61,7 +61,7 @@ class ProgressEntry(BaseModel):
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
     def to_storage(self) -> dict:
-        return self.model_dump()
+        return {name: getattr(self, name) for name in type(self).model_fields}
 
     def to_response(self) -> dict:
         return {
@@ -44,3 +44,11 @@ CREATE TABLE IF NOT EXISTS workspace_members (
     joined_at TEXT NOT NULL,
     PRIMARY KEY (workspace_id, user_id)
 );
+
+-- The primary key already serves lookups by workspace; this one serves lookups by user.
+CREATE INDEX IF NOT EXISTS idx_wm_user_ws ON workspace_members(user_id, workspace_id);
+
+-- Newest-first listings page through these instead of sorting the whole table.
+CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_orgs_created_at ON organizations(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_workspaces_created_at ON workspaces(created_at DESC);
@@ -95,10 +95,18 @@ CREATE TABLE IF NOT EXISTS ideas (
 -- Context Router
 CREATE TABLE IF NOT EXISTS routes (
     keyword TEXT NOT NULL PRIMARY KEY,
-    node_ids JSON NOT NULL,
     confidence REAL NOT NULL
 );
 
+-- One row per routed node, in insertion order
+CREATE TABLE IF NOT EXISTS route_nodes (
+    keyword TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (keyword, node_id)
+);
+CREATE INDEX IF NOT EXISTS idx_route_nodes_node ON route_nodes(node_id);
+
 -- Activity Log
 CREATE TABLE IF NOT EXISTS activity_log (
     id TEXT PRIMARY KEY,
@@ -114,7 +122,9 @@ CREATE TABLE IF NOT EXISTS activity_log (
 CREATE INDEX IF NOT EXISTS idx_nodes_ns_type ON nodes(namespace, type) WHERE deleted_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_nodes_created_by ON nodes(created_by) WHERE deleted_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_nodes_visibility ON nodes(visibility) WHERE deleted_at IS NULL;
-CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id);
+-- The edges primary key (source_id, target_id, type) already serves source_id
+-- lookups and exact-edge deletes; the old single-column index only slowed writes.
+DROP INDEX IF EXISTS idx_edges_source;
 CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id);
 CREATE INDEX IF NOT EXISTS idx_experiences_type ON experiences(type);
 CREATE INDEX IF NOT EXISTS idx_experiences_score ON experiences(score);
@@ -5,9 +5,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Annotated, Any
 
 from fastmcp import FastMCP
+from mcp import types as mcp_types
 from pydantic import Field
 
 from kairn.core.experience import ExperienceEngine
@@ -19,57 +23,87 @@ from kairn.core.router import ContextRouter
 from kairn.events.bus import EventBus
 from kairn.storage.sqlite_store import SQLiteStore
 
+try:
+    from orjson import dumps as _orjson_dumps  # pyright: ignore[reportMissingImports]
+except ImportError:  # the ``fast`` extra is not installed
+    _orjson_dumps = None
+
 logger = logging.getLogger(__name__)
 
 
 def _json(data: dict[str, Any]) -> str:
-    return json.dumps(data, default=str)
+    # Response builders only emit JSON-native values (ids and timestamps are
+    # already strings), so there is no need for a ``default=`` fallback. The
+    # stdlib path uses orjson's compact, non-ASCII-escaped output so tool
+    # responses are identical with or without the ``fast`` extra.
+    if _orjson_dumps is not None:
+        return _orjson_dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass(slots=True)
+class _Engines:
+    """Storage, event bus, and engines shared by every tool."""
+
+    store: SQLiteStore
+    bus: EventBus
+    graph: GraphEngine
+    router: ContextRouter
+    memory: ProjectMemory
+    experience: ExperienceEngine
+    ideas: IdeaEngine
+    intel: IntelligenceLayer
 
 
 def create_server(db_path: str) -> FastMCP:
     """Create FastMCP server: 18 tools (5 graph + 3 project + 3 exp + 2 ideas + 5 intel)."""
     mcp = FastMCP("kairn", version="0.1.0")
 
-    state: dict[str, Any] = {}
+    engines: _Engines | None = None
+    init_failed = False
     _lock = asyncio.Lock()
 
-    async def _init() -> dict[str, Any]:
+    async def _init() -> _Engines:
+        nonlocal engines, init_failed
+        # Fast path: once initialized, tool calls never touch the lock.
+        if engines is not None:
+            return engines
         async with _lock:
-            if "init_failed" in state:
+            if init_failed:
                 raise RuntimeError(f"Kairn init previously failed for {db_path}")
-            if "graph" not in state:
-                from pathlib import Path
-
+            if engines is None:
                 try:
                     store = SQLiteStore(Path(db_path))
                     await store.initialize()
                 except Exception as e:
-                    state["init_failed"] = True
+                    init_failed = True
                     logger.error("Failed to initialize database: %s", e)
                     raise RuntimeError(f"Kairn init failed: {db_path}") from e
                 bus = EventBus()
-                state["store"] = store
-                state["bus"] = bus
                 graph = GraphEngine(store, bus)
                 router = ContextRouter(store, bus)
                 memory = ProjectMemory(store, bus)
                 experience = ExperienceEngine(store, bus)
                 ideas = IdeaEngine(store, bus)
-                state["graph"] = graph
-                state["router"] = router
-                state["memory"] = memory
-                state["experience"] = experience
-                state["ideas"] = ideas
-                state["intel"] = IntelligenceLayer(
+                engines = _Engines(
                     store=store,
-                    event_bus=bus,
+                    bus=bus,
                     graph=graph,
                     router=router,
                     memory=memory,
                     experience=experience,
                     ideas=ideas,
+                    intel=IntelligenceLayer(
+                        store=store,
+                        event_bus=bus,
+                        graph=graph,
+                        router=router,
+                        memory=memory,
+                        experience=experience,
+                        ideas=ideas,
+                    ),
                 )
-        return state
+            return engines
 
     @mcp.tool()
     async def kn_add(
@@ -106,14 +140,14 @@ def create_server(db_path: str) -> FastMCP:
             return _json({"_v": "1.0", "error": "type is required"})
 
         s = await _init()
-        node = await s["graph"].add_node(
+        node = await s.graph.add_node(
             name=name.strip(),
             type=type.strip(),
             namespace=namespace,
             description=description,
             tags=tags,
         )
-        await s["router"].update_routes_for_node(
+        await s.router.update_routes_for_node(
             node.id,
             node.name,
             node.description,
@@ -146,7 +180,7 @@ def create_server(db_path: str) -> FastMCP:
 
         s = await _init()
         try:
-            edge = await s["graph"].connect(
+            edge = await s.graph.connect(
                 source_id,
                 target_id,
                 edge_type,
@@ -208,7 +242,7 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """Search nodes by text, type, tags, or namespace."""
         s = await _init()
-        nodes = await s["graph"].query(
+        nodes = await s.graph.query(
             text=text,
             namespace=namespace,
             node_type=node_type,
@@ -256,7 +290,7 @@ def create_server(db_path: str) -> FastMCP:
         s = await _init()
 
         if node_id and node_id.strip():
-            ok = await s["graph"].remove_node(node_id)
+            ok = await s.graph.remove_node(node_id)
             if ok:
                 return _json(
                     {
@@ -273,7 +307,7 @@ def create_server(db_path: str) -> FastMCP:
             )
 
         if source_id and target_id and edge_type:
-            ok = await s["graph"].disconnect(
+            ok = await s.graph.disconnect(
                 source_id,
                 target_id,
                 edge_type,
@@ -300,7 +334,7 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_status() -> str:
         """Graph stats, health, and system overview."""
         s = await _init()
-        stats = await s["graph"].stats()
+        stats = await s.graph.stats()
         stats["_v"] = "1.0"
         return _json(stats)
 
@@ -335,7 +369,7 @@ def create_server(db_path: str) -> FastMCP:
             return _json({"_v": "1.0", "error": "name is required"})
 
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
 
         if project_id:
             # Update existing
@@ -396,14 +430,14 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """List projects and switch active."""
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
 
         if set_active:
-            ok = await mem.set_active_project(set_active)
+            ok, projects = await mem.set_active_and_list(set_active, active_only=active_only)
             if not ok:
                 return _json({"_v": "1.0", "error": f"Project not found: {set_active}"})
-
-        projects = await mem.list_projects(active_only=active_only)
+        else:
+            projects = await mem.list_projects(active_only=active_only)
         items = [
             {
                 "id": p.id,
@@ -439,7 +473,7 @@ def create_server(db_path: str) -> FastMCP:
             return _json({"_v": "1.0", "error": "action is required"})
 
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
 
         if type == "failure":
             entry = await mem.log_failure(
@@ -494,7 +528,7 @@ def create_server(db_path: str) -> FastMCP:
 
         s = await _init()
         try:
-            exp = await s["experience"].save(
+            exp = await s.experience.save(
                 content=content.strip(),
                 type=type,
                 context=context,
@@ -544,20 +578,21 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """Decay-aware experience search."""
         s = await _init()
-        experiences = await s["experience"].search(
+        experiences = await s.experience.search(
             text=text,
             exp_type=type,
             min_relevance=min_relevance,
             limit=limit,
             offset=offset,
         )
+        now = time.time()
         items = [
             {
                 "id": e.id,
                 "type": e.type,
                 "content": e.content,
                 "confidence": e.confidence,
-                "relevance": round(e.relevance(), 4),
+                "relevance": round(e.relevance(at=now), 4),
                 "tags": e.tags,
             }
             for e in experiences
@@ -577,7 +612,7 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """Remove expired experiences (archive first)."""
         s = await _init()
-        pruned = await s["experience"].prune(threshold=threshold)
+        pruned = await s.experience.prune(threshold=threshold)
         return _json(
             {
                 "_v": "1.0",
@@ -617,7 +652,7 @@ def create_server(db_path: str) -> FastMCP:
             return _json({"_v": "1.0", "error": "title is required"})
 
         s = await _init()
-        ideas_engine = s["ideas"]
+        ideas_engine = s.ideas
 
         if idea_id:
             # Update existing
@@ -684,7 +719,7 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """List and filter ideas by status/score."""
         s = await _init()
-        ideas_list = await s["ideas"].list_ideas(
+        ideas_list = await s.ideas.list_ideas(
             status=status,
             category=category,
             limit=limit,
@@ -730,7 +765,7 @@ def create_server(db_path: str) -> FastMCP:
 
         s = await _init()
         try:
-            result = await s["intel"].learn(
+            result = await s.intel.learn(
                 content=content.strip(),
                 type=type,
                 context=context,
@@ -763,7 +798,7 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """Surface relevant past knowledge for context."""
         s = await _init()
-        results = await s["intel"].recall(
+        results = await s.intel.recall(
             topic=topic,
             limit=limit,
             min_relevance=min_relevance,
@@ -790,7 +825,7 @@ def create_server(db_path: str) -> FastMCP:
 
         s = await _init()
         try:
-            results = await s["intel"].crossref(
+            results = await s.intel.crossref(
                 problem=problem.strip(),
                 limit=limit,
             )
@@ -819,7 +854,7 @@ def create_server(db_path: str) -> FastMCP:
     ) -> str:
         """Keywords to relevant subgraph with progressive disclosure."""
         s = await _init()
-        result = await s["intel"].context(
+        result = await s.intel.context(
             keywords=keywords,
             detail=detail,
             limit=limit,
@@ -843,7 +878,7 @@ def create_server(db_path: str) -> FastMCP:
             return _json({"_v": "1.0", "error": "node_id is required"})
 
         s = await _init()
-        results = await s["intel"].related(
+        results = await s.intel.related(
             node_id=node_id.strip(),
             depth=depth,
             edge_type=edge_type,
@@ -862,8 +897,8 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_resource_status() -> str:
         """Graph and system overview."""
         s = await _init()
-        stats = await s["graph"].stats()
-        projects = await s["memory"].list_projects(active_only=True)
+        stats = await s.graph.stats()
+        projects = await s.memory.list_projects(active_only=True)
         active = projects[0] if projects else None
         return _json(
             {
@@ -883,7 +918,7 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_resource_projects() -> str:
         """All projects with progress summaries."""
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
         projects = await mem.list_projects()
         items = []
         for p in projects:
@@ -904,17 +939,19 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_resource_memories() -> str:
         """Recent high-relevance experiences."""
         s = await _init()
-        experiences = await s["experience"].search(
+        experiences = await s.experience.search(
             min_relevance=0.1,
             limit=20,
+            content_max_len=200,
         )
+        now = time.time()
         items = [
             {
                 "id": e.id,
                 "type": e.type,
-                "content": e.content[:200],
+                "content": e.content,
                 "confidence": e.confidence,
-                "relevance": round(e.relevance(), 4),
+                "relevance": round(e.relevance(at=now), 4),
             }
             for e in experiences
         ]
@@ -926,7 +963,7 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_bootup() -> str:
         """Session start — load active project, recent progress, and top memories."""
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
 
         # Active project
         projects = await mem.list_projects(active_only=True)
@@ -941,8 +978,10 @@ def create_server(db_path: str) -> FastMCP:
                 progress_lines.append(f"  [{prefix}] {e.action}")
 
         # Top experiences
-        experiences = await s["experience"].search(min_relevance=0.3, limit=5)
-        memory_lines = [f"  [{e.type}] {e.content[:80]}" for e in experiences]
+        experiences = await s.experience.search(
+            min_relevance=0.3, limit=5, content_max_len=80
+        )
+        memory_lines = [f"  [{e.type}] {e.content}" for e in experiences]
 
         # Build context
         parts = ["# Kairn Session Context\n"]
@@ -963,7 +1002,7 @@ def create_server(db_path: str) -> FastMCP:
             parts.extend(memory_lines)
 
         # Ideas in progress
-        ideas = await s["ideas"].list_ideas(status="implementing", limit=3)
+        ideas = await s.ideas.list_ideas(status="implementing", limit=3)
         if ideas:
             parts.append("\n## Ideas in Progress")
             for idea in ideas:
@@ -975,7 +1014,7 @@ def create_server(db_path: str) -> FastMCP:
     async def kn_review() -> str:
         """Session review — summarize what happened and suggest next steps."""
         s = await _init()
-        mem = s["memory"]
+        mem = s.memory
 
         projects = await mem.list_projects(active_only=True)
         active = projects[0] if projects else None
@@ -1014,7 +1053,7 @@ def create_server(db_path: str) -> FastMCP:
             parts.append("No active project to review.")
 
         # Experience stats
-        all_exp = await s["experience"].search(limit=50)
+        all_exp = await s.experience.search(limit=50)
         if all_exp:
             by_type: dict[str, int] = {}
             for e in all_exp:
@@ -1026,3 +1065,17 @@ def create_server(db_path: str) -> FastMCP:
         return "\n".join(parts)
 
     return mcp
+
+
+async def list_tool_specs(db_path: str) -> list[mcp_types.Tool]:
+    """Tool definitions exactly as clients receive them, without a client session.
+
+    Building the server does not open the database, so this only registers the
+    tools and converts them; no transport or MCP handshake is involved.
+    """
+    mcp = create_server(db_path)
+    if hasattr(mcp, "list_tools"):
+        tools = await mcp.list_tools()
+    else:  # fastmcp 2.x
+        tools = list((await mcp.get_tools()).values())  # pyright: ignore[reportAttributeAccessIssue]
+    return [tool.to_mcp_tool() for tool in tools]
@@ -23,10 +23,18 @@ class StorageBackend(ABC):
     async def insert_node(self, node: dict[str, Any]) -> dict[str, Any]:
         """Insert a node. Returns the inserted node."""
 
+    @abstractmethod
+    async def insert_nodes(self, nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert several nodes in one transaction. Returns the inserted nodes."""
+
     @abstractmethod
     async def get_node(self, node_id: str) -> dict[str, Any] | None:
         """Get a node by ID. Returns None if not found or soft-deleted."""
 
+    @abstractmethod
+    async def get_nodes(self, node_ids: list[str]) -> list[dict[str, Any]]:
+        """Get several nodes by ID in one query, skipping missing and soft-deleted ones."""
+
     @abstractmethod
     async def update_node(self, node_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
         """Update a node. Returns updated node or None."""
@@ -35,6 +43,10 @@ class StorageBackend(ABC):
     async def soft_delete_node(self, node_id: str) -> bool:
         """Soft-delete a node. Returns True if found and deleted."""
 
+    @abstractmethod
+    async def soft_delete_nodes(self, node_ids: list[str]) -> int:
+        """Soft-delete several nodes in one transaction. Returns how many were deleted."""
+
     @abstractmethod
     async def restore_node(self, node_id: str) -> bool:
         """Restore a soft-deleted node. Returns True if found and restored."""
@@ -51,7 +63,11 @@ class StorageBackend(ABC):
         limit: int = 10,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
-        """Query nodes with filters. FTS5 used when text is provided."""
+        """Query nodes with filters. FTS5 used when text is provided.
+
+        Text matches should be resolved on their own (e.g. in a CTE) before
+        the column filters are applied, so filters never cost the FTS index.
+        """
 
     @abstractmethod
     async def count_nodes(self, *, namespace: str | None = None) -> int:
@@ -63,6 +79,13 @@ class StorageBackend(ABC):
     async def insert_edge(self, edge: dict[str, Any]) -> dict[str, Any]:
         """Insert an edge. Returns the inserted edge."""
 
+    @abstractmethod
+    async def insert_edges(self, edges: list[dict[str, Any]]) -> int:
+        """Insert several edges in one transaction, skipping ones that already exist.
+
+        Returns how many were inserted.
+        """
+
     @abstractmethod
     async def get_edges(
         self,
@@ -73,6 +96,15 @@ class StorageBackend(ABC):
     ) -> list[dict[str, Any]]:
         """Get edges by source, target, or type."""
 
+    @abstractmethod
+    async def get_incident_edges(
+        self, node_ids: list[str], *, edge_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get edges touching any of node_ids in one query.
+
+        An edge whose ends are both in node_ids is returned once per end.
+        """
+
     @abstractmethod
     async def delete_edge(self, source_id: str, target_id: str, edge_type: str) -> bool:
         """Delete an edge. Returns True if found and deleted."""
@@ -104,10 +136,20 @@ class StorageBackend(ABC):
         exp_type: str | None = None,
         text: str | None = None,
         min_score: float | None = None,
+        min_relevance: float | None = None,
+        order_by_relevance: bool = False,
         limit: int = 10,
         offset: int = 0,
+        content_max_len: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Query experiences with filters. FTS5 used when text is provided."""
+        """Query experiences with filters. FTS5 used when text is provided.
+
+        As with query_nodes, text matches are resolved before column filters.
+        When content_max_len is set, content is truncated by the backend so
+        callers that only render a preview never load the full text.
+        min_relevance and order_by_relevance use the decayed relevance of
+        Experience.relevance(), evaluated by the backend at query time.
+        """
 
     @abstractmethod
     async def increment_access_count(self, exp_id: str) -> dict[str, Any] | None:
@@ -117,10 +159,18 @@ class StorageBackend(ABC):
     async def delete_experience(self, exp_id: str) -> bool:
         """Hard-delete an experience."""
 
+    @abstractmethod
+    async def delete_experiences(self, exp_ids: list[str]) -> int:
+        """Hard-delete several experiences in one transaction. Returns how many were deleted."""
+
     @abstractmethod
     async def get_promotable_experiences(self) -> list[dict[str, Any]]:
         """Get experiences flagged for promotion (needs_promotion=1)."""
 
+    @abstractmethod
+    async def get_expired_experiences(self, threshold: float) -> list[dict[str, Any]]:
+        """Get id and current relevance of experiences whose relevance is below threshold."""
+
     # --- Project operations ---
 
     @abstractmethod
@@ -143,7 +193,21 @@ class StorageBackend(ABC):
 
     @abstractmethod
     async def set_active_project(self, project_id: str) -> bool:
-        """Set a project as active (deactivates others)."""
+        """Set a project as active (deactivates others).
+
+        Implementations should flip every row in one statement, e.g.
+        ``UPDATE projects SET active = (id = ?)``, so activation takes the
+        write lock once. Returns False, changing nothing, if the project is unknown.
+        """
+
+    @abstractmethod
+    async def set_active_and_list_projects(
+        self, project_id: str, *, active_only: bool = False
+    ) -> tuple[bool, list[dict[str, Any]]]:
+        """Activate a project and list projects in one transaction.
+
+        Returns (found, projects); projects reflects the state after activation.
+        """
 
     # --- Progress operations ---
 
@@ -151,6 +215,10 @@ class StorageBackend(ABC):
     async def insert_progress(self, entry: dict[str, Any]) -> dict[str, Any]:
         """Insert a progress/failure entry."""
 
+    @abstractmethod
+    async def insert_progress_many(self, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert several progress/failure entries in one transaction."""
+
     @abstractmethod
     async def get_progress(
         self, project_id: str, *, entry_type: str | None = None, limit: int = 10
@@ -169,7 +237,7 @@ class StorageBackend(ABC):
 
     @abstractmethod
     async def update_idea(self, idea_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
-        """Update an idea."""
+        """Update an idea. Returns the updated row, or None if not found."""
 
     @abstractmethod
     async def list_ideas(
@@ -188,9 +256,17 @@ class StorageBackend(ABC):
     async def upsert_route(self, keyword: str, node_ids: list[str], confidence: float) -> None:
         """Insert or update a context route."""
 
+    @abstractmethod
+    async def upsert_routes(self, routes: list[tuple[str, list[str], float]]) -> None:
+        """Insert or update several (keyword, node_ids, confidence) routes in one transaction."""
+
     @abstractmethod
     async def get_routes(self, keywords: list[str]) -> list[dict[str, Any]]:
-        """Get routes matching keywords."""
+        """Get routes matching keywords.
+
+        Implementations should fetch all keywords in one batched query
+        (e.g. ``WHERE keyword IN (...)``) rather than one query per keyword.
+        """
 
     # --- Activity log ---
 
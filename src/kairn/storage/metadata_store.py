@@ -2,51 +2,150 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import UTC, datetime
+from importlib import resources
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+from kairn.storage.pool import ConnectionPool
+
 logger = logging.getLogger(__name__)
 
 
+# Read-only connections kept open per store; WAL lets them all read concurrently
+# while the single writer connection serialises mutations.
+_READ_POOL_SIZE = 4
+
+# Long-running processes refresh planner statistics this often, not only on close.
+_OPTIMIZE_EVERY_WRITES = 1000
+
+# Columns update_user may touch.
+_USER_UPDATE_FIELDS = frozenset({"name", "last_active", "is_active"})
+
+# UPDATE ... RETURNING landed in SQLite 3.35.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Applied to every connection. synchronous=NORMAL stays crash-safe under WAL: a
+# power loss can drop the last commits but never corrupts the database.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Explicit column lists, so reads only copy the columns the API returns.
+_USER_COLUMNS = "user_id, email, name, created_at, auth_provider, is_active, last_active"
+_ORG_COLUMNS = "org_id, name, created_at, created_by, plan_tier, max_workspaces, max_members"
+_WORKSPACE_COLUMNS = (
+    "{p}workspace_id, {p}org_id, {p}name, {p}description, {p}created_at, {p}created_by, "
+    "{p}visibility, {p}workspace_type, {p}repo_url, {p}tech_stack"
+)
+_MEMBER_COLUMNS = "workspace_id, user_id, role, joined_at"
+
+# sqlite3 keeps compiled statements per connection, keyed by SQL text. Pooled
+# connections live for the store's lifetime, so hot point lookups share one
+# constant string each and are only parsed once per connection.
+_STATEMENT_CACHE_SIZE = 256
+_SQL_GET_USER = f"SELECT {_USER_COLUMNS} FROM users WHERE user_id = ?"
+_SQL_GET_ORG = f"SELECT {_ORG_COLUMNS} FROM organizations WHERE org_id = ?"
+_SQL_GET_WORKSPACE = (
+    f"SELECT {_WORKSPACE_COLUMNS.format(p='')} FROM workspaces WHERE workspace_id = ?"
+)
+_SQL_GET_MEMBER_ROLE = "SELECT role FROM workspace_members WHERE workspace_id = ? AND user_id = ?"
+_SQL_LIST_USERS = f"SELECT {_USER_COLUMNS} FROM users ORDER BY created_at DESC LIMIT ? OFFSET ?"
+_SQL_LIST_ORGS = (
+    f"SELECT {_ORG_COLUMNS} FROM organizations ORDER BY created_at DESC LIMIT ? OFFSET ?"
+)
+_SQL_LIST_WORKSPACES = (
+    f"SELECT {_WORKSPACE_COLUMNS.format(p='')} FROM workspaces "
+    "ORDER BY created_at DESC LIMIT ? OFFSET ?"
+)
+
+
 class MetadataStore:
     """SQLite-based metadata store for team features."""
 
     def __init__(self, db_path: Path, *, wal_mode: bool = True) -> None:
         self.db_path = db_path
         self.wal_mode = wal_mode
-        self._db: aiosqlite.Connection | None = None
+        self._writer: ConnectionPool | None = None
+        self._readers: ConnectionPool | None = None
+        self._writes = 0
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a pooled connection with the store's pragmas applied."""
+        conn = await aiosqlite.connect(str(self.db_path), cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = aiosqlite.Row
+        if self.wal_mode and not self._in_memory:
+            await conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+
+    @property
+    def _in_memory(self) -> bool:
+        return str(self.db_path) == ":memory:"
+
+    async def _connect_reader(self) -> aiosqlite.Connection:
+        conn = await self._connect()
+        await conn.execute("PRAGMA query_only=ON")
+        return conn
 
     async def initialize(self) -> None:
         """Create database and apply schema."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = await aiosqlite.connect(str(self.db_path))
-        self._db.row_factory = aiosqlite.Row
-
-        if self.wal_mode:
-            await self._db.execute("PRAGMA journal_mode=WAL")
-        await self._db.execute("PRAGMA foreign_keys=ON")
+        self._writer = ConnectionPool(self._connect, size=1)
+        if self._in_memory:
+            # Each connection to ":memory:" opens its own empty database, so reads
+            # go through the one writer connection that holds the schema.
+            self._readers = self._writer
+        else:
+            self._readers = ConnectionPool(self._connect_reader, size=_READ_POOL_SIZE)
 
         schema_sql = _load_sql("metadata.sql")
-        await self._db.executescript(schema_sql)
-        await self._db.commit()
+        async with self._write() as conn:
+            await conn.executescript(schema_sql)
+            await conn.commit()
         logger.info("Initialized metadata store at %s", self.db_path)
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Refresh planner statistics, then close all pooled database connections."""
+        if self._writer:
+            async with self._writer.connection() as conn:
+                await conn.execute("PRAGMA optimize")
+        if self._writer:
+            await self._writer.close()
+        if self._readers and self._readers is not self._writer:
+            await self._readers.close()
+        self._writer = None
+        self._readers = None
+
+    def _read(self) -> AbstractAsyncContextManager[aiosqlite.Connection]:
+        """Borrow a read-only connection."""
+        if self._readers is None:
+            raise RuntimeError("Store not initialized. Call initialize() first.")
+        return self._readers.connection()
 
-    @property
-    def db(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        if self._db is None:
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the single writer connection, waiting for other writers."""
+        if self._writer is None:
             raise RuntimeError("Store not initialized. Call initialize() first.")
-        return self._db
+        async with self._writer.connection() as conn:
+            yield conn
+            self._writes += 1
+            if self._writes % _OPTIMIZE_EVERY_WRITES == 0:
+                await conn.execute("PRAGMA optimize")
 
     async def create_user(
         self,
@@ -57,13 +156,14 @@ class MetadataStore:
         auth_provider: str = "local",
     ) -> dict[str, Any]:
         """Create a new user."""
-        now = datetime.now(UTC).isoformat()
-        await self.db.execute(
-            """INSERT INTO users (user_id, email, name, created_at, auth_provider, is_active)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (user_id, email, name, now, auth_provider, True),
-        )
-        await self.db.commit()
+        now = _utc_now_iso()
+        async with self._write() as conn:
+            await conn.execute(
+                """INSERT INTO users (user_id, email, name, created_at, auth_provider, is_active)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (user_id, email, name, now, auth_provider, True),
+            )
+            await conn.commit()
         return {
             "user_id": user_id,
             "email": email,
@@ -76,40 +176,42 @@ class MetadataStore:
 
     async def get_user(self, user_id: str) -> dict[str, Any] | None:
         """Get a user by ID."""
-        cursor = await self.db.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(_SQL_GET_USER, (user_id,))
+            row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
     async def update_user(self, user_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
-        """Update a user."""
-        existing = await self.get_user(user_id)
-        if not existing:
-            return None
-
-        allowed_fields = {"name", "last_active", "is_active"}
-        filtered = {k: v for k, v in updates.items() if k in allowed_fields}
-
+        """Update a user and return the updated row in a single round-trip."""
+        filtered = {k: v for k, v in updates.items() if k in _USER_UPDATE_FIELDS}
         if not filtered:
-            return existing
-
-        set_clauses = []
-        values = []
-        for key, value in filtered.items():
-            set_clauses.append(f"{key} = ?")
-            values.append(value)
-
-        values.append(user_id)
-        await self.db.execute(
-            f"UPDATE users SET {', '.join(set_clauses)} WHERE user_id = ?",
-            values,
-        )
-        await self.db.commit()
-        return await self.get_user(user_id)
-
-    async def list_users(self) -> list[dict[str, Any]]:
-        """List all users."""
-        cursor = await self.db.execute("SELECT * FROM users ORDER BY created_at DESC")
-        rows = await cursor.fetchall()
+            return await self.get_user(user_id)
+
+        # Keys are whitelisted above, so interpolating them into SQL is safe.
+        set_clause = ", ".join(f"{key} = ?" for key in filtered)
+        values = [*filtered.values(), user_id]
+        async with self._write() as conn:
+            if _HAS_RETURNING:
+                cursor = await conn.execute(
+                    f"UPDATE users SET {set_clause} WHERE user_id = ? RETURNING {_USER_COLUMNS}",
+                    values,
+                )
+                row = await cursor.fetchone()
+            else:
+                await conn.execute(f"UPDATE users SET {set_clause} WHERE user_id = ?", values)
+                cursor = await conn.execute(_SQL_GET_USER, (user_id,))
+                row = await cursor.fetchone()
+            await conn.commit()
+        return _row_to_dict(row) if row else None
+
+    async def list_users(self, *, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+        """List users, newest first."""
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                _SQL_LIST_USERS,
+                (limit, offset),
+            )
+            rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def create_org(
@@ -123,14 +225,15 @@ class MetadataStore:
         max_members: int = 1,
     ) -> dict[str, Any]:
         """Create a new organization."""
-        now = datetime.now(UTC).isoformat()
-        await self.db.execute(
-            """INSERT INTO organizations (org_id, name, created_at, created_by,
-               plan_tier, max_workspaces, max_members)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (org_id, name, now, created_by, plan_tier, max_workspaces, max_members),
-        )
-        await self.db.commit()
+        now = _utc_now_iso()
+        async with self._write() as conn:
+            await conn.execute(
+                """INSERT INTO organizations (org_id, name, created_at, created_by,
+                   plan_tier, max_workspaces, max_members)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (org_id, name, now, created_by, plan_tier, max_workspaces, max_members),
+            )
+            await conn.commit()
         return {
             "org_id": org_id,
             "name": name,
@@ -143,14 +246,19 @@ class MetadataStore:
 
     async def get_org(self, org_id: str) -> dict[str, Any] | None:
         """Get an organization by ID."""
-        cursor = await self.db.execute("SELECT * FROM organizations WHERE org_id = ?", (org_id,))
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(_SQL_GET_ORG, (org_id,))
+            row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
-    async def list_orgs(self) -> list[dict[str, Any]]:
-        """List all organizations."""
-        cursor = await self.db.execute("SELECT * FROM organizations ORDER BY created_at DESC")
-        rows = await cursor.fetchall()
+    async def list_orgs(self, *, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+        """List organizations, newest first."""
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                _SQL_LIST_ORGS,
+                (limit, offset),
+            )
+            rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def create_workspace(
@@ -167,25 +275,26 @@ class MetadataStore:
         tech_stack: str | None = None,
     ) -> dict[str, Any]:
         """Create a new workspace."""
-        now = datetime.now(UTC).isoformat()
-        await self.db.execute(
-            """INSERT INTO workspaces (workspace_id, org_id, name, description,
-               created_at, created_by, visibility, workspace_type, repo_url, tech_stack)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                workspace_id,
-                org_id,
-                name,
-                description,
-                now,
-                created_by,
-                visibility,
-                workspace_type,
-                repo_url,
-                tech_stack,
-            ),
-        )
-        await self.db.commit()
+        now = _utc_now_iso()
+        async with self._write() as conn:
+            await conn.execute(
+                """INSERT INTO workspaces (workspace_id, org_id, name, description,
+                   created_at, created_by, visibility, workspace_type, repo_url, tech_stack)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    workspace_id,
+                    org_id,
+                    name,
+                    description,
+                    now,
+                    created_by,
+                    visibility,
+                    workspace_type,
+                    repo_url,
+                    tech_stack,
+                ),
+            )
+            await conn.commit()
         return {
             "workspace_id": workspace_id,
             "org_id": org_id,
@@ -201,80 +310,112 @@ class MetadataStore:
 
     async def get_workspace(self, workspace_id: str) -> dict[str, Any] | None:
         """Get a workspace by ID."""
-        cursor = await self.db.execute(
-            "SELECT * FROM workspaces WHERE workspace_id = ?", (workspace_id,)
-        )
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(_SQL_GET_WORKSPACE, (workspace_id,))
+            row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
-    async def list_workspaces(self) -> list[dict[str, Any]]:
-        """List all workspaces."""
-        cursor = await self.db.execute("SELECT * FROM workspaces ORDER BY created_at DESC")
-        rows = await cursor.fetchall()
+    async def list_workspaces(self, *, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+        """List workspaces, newest first."""
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                _SQL_LIST_WORKSPACES,
+                (limit, offset),
+            )
+            rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def list_workspaces_for_user(self, user_id: str) -> list[dict[str, Any]]:
         """List all workspaces a user is a member of."""
-        cursor = await self.db.execute(
-            """SELECT w.* FROM workspaces w
-               JOIN workspace_members wm ON w.workspace_id = wm.workspace_id
-               WHERE wm.user_id = ?
-               ORDER BY w.created_at DESC""",
-            (user_id,),
-        )
-        rows = await cursor.fetchall()
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                f"""SELECT {_WORKSPACE_COLUMNS.format(p="w.")} FROM workspaces w
+                   JOIN workspace_members wm ON w.workspace_id = wm.workspace_id
+                   WHERE wm.user_id = ?
+                   ORDER BY w.created_at DESC""",
+                (user_id,),
+            )
+            rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def add_member(
         self, workspace_id: str, user_id: str, role: str = "contributor"
     ) -> dict[str, Any]:
         """Add a member to a workspace."""
-        now = datetime.now(UTC).isoformat()
-        await self.db.execute(
-            """INSERT INTO workspace_members (workspace_id, user_id, role, joined_at)
-               VALUES (?, ?, ?, ?)""",
-            (workspace_id, user_id, role, now),
-        )
-        await self.db.commit()
-        return {
-            "workspace_id": workspace_id,
-            "user_id": user_id,
-            "role": role,
-            "joined_at": now,
-        }
+        (member,) = await self.add_members(workspace_id, [(user_id, role)])
+        return member
+
+    async def add_members(
+        self, workspace_id: str, members: list[tuple[str, str]]
+    ) -> list[dict[str, Any]]:
+        """Add several (user_id, role) members to a workspace in one transaction."""
+        now = _utc_now_iso()
+        rows = [(workspace_id, user_id, role, now) for user_id, role in members]
+        if not rows:
+            return []
+        async with self._write() as conn:
+            await conn.executemany(
+                """INSERT INTO workspace_members (workspace_id, user_id, role, joined_at)
+                   VALUES (?, ?, ?, ?)""",
+                rows,
+            )
+            await conn.commit()
+        return [
+            {"workspace_id": ws_id, "user_id": user_id, "role": role, "joined_at": joined_at}
+            for ws_id, user_id, role, joined_at in rows
+        ]
 
     async def remove_member(self, workspace_id: str, user_id: str) -> bool:
         """Remove a member from a workspace."""
-        cursor = await self.db.execute(
-            "DELETE FROM workspace_members WHERE workspace_id = ? AND user_id = ?",
-            (workspace_id, user_id),
-        )
-        await self.db.commit()
+        async with self._write() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM workspace_members WHERE workspace_id = ? AND user_id = ?",
+                (workspace_id, user_id),
+            )
+            await conn.commit()
         return cursor.rowcount > 0
 
     async def get_members(self, workspace_id: str) -> list[dict[str, Any]]:
         """Get all members of a workspace."""
-        cursor = await self.db.execute(
-            "SELECT * FROM workspace_members WHERE workspace_id = ?",
-            (workspace_id,),
-        )
-        rows = await cursor.fetchall()
+        async with self._read() as conn:
+            cursor = await conn.execute(
+                f"SELECT {_MEMBER_COLUMNS} FROM workspace_members WHERE workspace_id = ?",
+                (workspace_id,),
+            )
+            rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def get_member_role(self, workspace_id: str, user_id: str) -> str | None:
         """Get a user's role in a workspace."""
-        cursor = await self.db.execute(
-            "SELECT role FROM workspace_members WHERE workspace_id = ? AND user_id = ?",
-            (workspace_id, user_id),
-        )
-        row = await cursor.fetchone()
+        async with self._read() as conn:
+            cursor = await conn.execute(_SQL_GET_MEMBER_ROLE, (workspace_id, user_id))
+            row = await cursor.fetchone()
         return row["role"] if row else None
 
 
+# (unix second, formatted prefix) of the last timestamp, reused within the same second.
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as a fixed-width ISO 8601 string with microseconds.
+
+    Unlike datetime.isoformat(), the fraction is never dropped, so stored
+    timestamps always sort correctly as text.
+    """
+    global _iso_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _iso_second
+    if seconds != cached_second:
+        prefix = datetime.fromtimestamp(seconds, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second = (seconds, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
+
+@functools.lru_cache(maxsize=8)
 def _load_sql(filename: str) -> str:
-    """Load SQL file from the schema package."""
-    schema_dir = Path(__file__).parent.parent / "schema"
-    return (schema_dir / filename).read_text()
+    """Load SQL file from the schema package (read once per process)."""
+    return resources.files("kairn.schema").joinpath(filename).read_text()
 
 
 def _row_to_dict(row: aiosqlite.Row) -> dict[str, Any]:
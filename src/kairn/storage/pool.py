@@ -0,0 +1,66 @@
+"""Fixed-size pool of aiosqlite connections."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+ConnectionFactory = Callable[[], Awaitable[aiosqlite.Connection]]
+
+
+class ConnectionPool:
+    """Hands out long-lived aiosqlite connections, opening them on demand.
+
+    Each aiosqlite connection runs on its own worker thread, so concurrent
+    operations acquire separate connections instead of queueing behind one.
+    """
+
+    def __init__(self, factory: ConnectionFactory, *, size: int = 4) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self._factory = factory
+        self.size = size
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+        self._opening = 0
+        self._closed = False
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed.")
+        if self._idle.empty() and len(self._connections) + self._opening < self.size:
+            # Reserve the slot before awaiting so concurrent callers can't overshoot.
+            self._opening += 1
+            try:
+                conn = await self._factory()
+            finally:
+                self._opening -= 1
+            self._connections.append(conn)
+            return conn
+        return await self._idle.get()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection for the duration of the block.
+
+        Any transaction left open by the block is rolled back before the
+        connection is returned, so the next borrower starts clean.
+        """
+        conn = await self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                await conn.rollback()
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection the pool has opened."""
+        self._closed = True
+        connections, self._connections = self._connections, []
+        for conn in connections:
+            await conn.close()
+        self._idle = asyncio.Queue()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import math
+import sqlite3
+from collections.abc import Awaitable, Callable
+from importlib import resources
 from pathlib import Path
 from typing import Any
 
@@ -66,6 +71,116 @@ _ALLOWED_COLUMNS: dict[str, set[str]] = {
 }
 
 
+_EXPERIENCE_COLUMNS = (
+    "id",
+    "type",
+    "content",
+    "context",
+    "confidence",
+    "score",
+    "decay_rate",
+    "tags",
+    "properties",
+    "created_by",
+    "access_count",
+    "promoted_to_node_id",
+    "created_at",
+    "last_accessed",
+)
+
+
+def _experience_projection(content_max_len: int | None, *, table: str = "") -> str:
+    """Build the experiences column list, truncating content via SUBSTR if requested."""
+    if content_max_len is None:
+        return f"{table}.*" if table else "*"
+    prefix = f"{table}." if table else ""
+    return ", ".join(
+        f"SUBSTR({prefix}content, 1, ?) AS content" if col == "content" else f"{prefix}{col}"
+        for col in _EXPERIENCE_COLUMNS
+    )
+
+
+def _relevance_sql(table: str = "") -> str:
+    """SQL for Experience.relevance(): score decayed by age in days since created_at."""
+    prefix = f"{table}." if table else ""
+    return (
+        f"{prefix}score * exp(-{prefix}decay_rate"
+        f" * (julianday('now') - julianday({prefix}created_at)))"
+    )
+
+
+# UPDATE ... RETURNING landed in SQLite 3.35.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# MATERIALIZED (SQLite 3.35+) stops the planner from flattening the FTS CTE back
+# into the filtered join.
+_CTE_MATERIALIZED = "MATERIALIZED " if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+
+def _fts_search_sql(
+    table: str, projection: str, conditions: list[str], *, order_by: str = "fts_matches.rank"
+) -> str:
+    """Build an FTS5 search that resolves MATCH in a CTE before filtering.
+
+    Keeping column filters out of the MATCH statement means they can never
+    steer the planner away from the full-text index. Placeholders, in order:
+    the MATCH expression, any in ``projection``, one per condition, then
+    LIMIT and OFFSET.
+    """
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"""
+        WITH fts_matches AS {_CTE_MATERIALIZED}(
+            SELECT rowid, rank FROM {table}_fts WHERE {table}_fts MATCH ?
+        )
+        SELECT {projection}, fts_matches.rank AS rank
+        FROM fts_matches
+        JOIN {table} ON {table}.rowid = fts_matches.rowid
+        {where}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+    """
+
+
+# Shared by insert_node and insert_nodes.
+_INSERT_NODE_SQL = """INSERT INTO nodes (id, namespace, type, name, description,
+    properties, tags, created_by, visibility, source_type,
+    source_ref, created_at, updated_at)
+    VALUES (:id, :namespace, :type, :name, :description,
+    :properties, :tags, :created_by, :visibility, :source_type,
+    :source_ref, :created_at, :updated_at)"""
+
+# Shared by insert_progress and insert_progress_many.
+_INSERT_PROGRESS_SQL = """INSERT INTO progress (id, project_id, type, action, result, next_step,
+    created_by, created_at)
+    VALUES (:id, :project_id, :type, :action, :result, :next_step,
+    :created_by, :created_at)"""
+
+# Keeps IN (...) lists well under SQLITE_MAX_VARIABLE_NUMBER on older builds.
+_DELETE_BATCH_SIZE = 500
+
+# Applied to every connection. synchronous=NORMAL is only durable under WAL, so
+# initialize() sets it next to journal_mode instead.
+_CONNECTION_PRAGMAS = (
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "busy_timeout=5000",
+)
+
+# Activates one project and deactivates the rest in a single statement. The EXISTS
+# guard leaves every row untouched when the project is unknown.
+_ACTIVATE_PROJECT_SQL = """UPDATE projects SET active = (id = ?)
+   WHERE EXISTS (SELECT 1 FROM projects WHERE id = ?)"""
+
+
+@functools.lru_cache(maxsize=16)
+def _routes_sql(slots: int) -> str:
+    placeholders = ",".join("?" * slots)
+    return f"""SELECT routes.keyword, routes.confidence, route_nodes.node_id
+        FROM routes LEFT JOIN route_nodes ON route_nodes.keyword = routes.keyword
+        WHERE routes.keyword IN ({placeholders})
+        ORDER BY routes.keyword, route_nodes.position"""
+
+
 def _validate_update_keys(table: str, updates: dict[str, Any]) -> dict[str, Any]:
     """Filter update dict to only allowed column names."""
     allowed = _ALLOWED_COLUMNS.get(table, set())
@@ -92,11 +207,21 @@ class SQLiteStore(StorageBackend):
 
         if self.wal_mode:
             await self._db.execute("PRAGMA journal_mode=WAL")
+            await self._db.execute("PRAGMA synchronous=NORMAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            await self._db.execute(f"PRAGMA {pragma}")
         await self._db.execute("PRAGMA foreign_keys=ON")
+        try:
+            await self._db.execute("SELECT exp(0)")
+        except sqlite3.OperationalError:
+            # Builds without SQLITE_ENABLE_MATH_FUNCTIONS lack exp(), which the
+            # experience relevance filter needs.
+            await self._db.create_function("exp", 1, math.exp, deterministic=True)
 
         # Apply workspace schema
         schema_sql = _load_sql("workspace.sql")
         await self._db.executescript(schema_sql)
+        await self._migrate_route_node_ids()
 
         # Apply triggers (FTS5 + auto-promotion)
         triggers_sql = _load_sql("triggers.sql")
@@ -105,6 +230,37 @@ class SQLiteStore(StorageBackend):
         await self._db.commit()
         logger.info("Initialized SQLite store at %s", self.db_path)
 
+    async def _migrate_route_node_ids(self) -> None:
+        """Move node_ids JSON arrays from pre-route_nodes databases into route_nodes."""
+        cursor = await self.db.execute("SELECT name FROM pragma_table_info('routes')")
+        if "node_ids" not in {row[0] for row in await cursor.fetchall()}:
+            return
+        # executescript runs in autocommit mode, so the copy/drop/rename is wrapped
+        # in one explicit transaction: a failure midway must not lose the routes.
+        try:
+            await self.db.executescript(
+                """
+                BEGIN;
+                INSERT OR IGNORE INTO route_nodes (keyword, node_id, position)
+                    SELECT routes.keyword, j.value, j.key
+                    FROM routes, json_each(routes.node_ids) AS j
+                    WHERE json_valid(routes.node_ids);
+                CREATE TABLE routes_migrated (
+                    keyword TEXT NOT NULL PRIMARY KEY,
+                    confidence REAL NOT NULL
+                );
+                INSERT INTO routes_migrated SELECT keyword, confidence FROM routes;
+                DROP TABLE routes;
+                ALTER TABLE routes_migrated RENAME TO routes;
+                COMMIT;
+                """
+            )
+        except BaseException:
+            if self.db.in_transaction:
+                await self.db.rollback()
+            raise
+        logger.info("Migrated route node_ids into route_nodes")
+
     async def close(self) -> None:
         if self._db:
             await self._db.close()
@@ -116,21 +272,44 @@ class SQLiteStore(StorageBackend):
             raise RuntimeError("Store not initialized. Call initialize() first.")
         return self._db
 
+    async def _update_returning(
+        self,
+        sql: str,
+        values: list[Any],
+        refetch: Callable[[str], Awaitable[dict[str, Any] | None]],
+        row_id: str,
+    ) -> dict[str, Any] | None:
+        """Run an UPDATE and return the updated row, or None if no row matched."""
+        if _HAS_RETURNING:
+            cursor = await self.db.execute(f"{sql} RETURNING *", values)
+            row = await cursor.fetchone()
+            await self.db.commit()
+            return _row_to_dict(row) if row else None
+        cursor = await self.db.execute(sql, values)
+        await self.db.commit()
+        return await refetch(row_id) if cursor.rowcount else None
+
     # --- Node operations ---
 
     async def insert_node(self, node: dict[str, Any]) -> dict[str, Any]:
         await self.db.execute(
-            """INSERT INTO nodes (id, namespace, type, name, description,
-               properties, tags, created_by, visibility, source_type,
-               source_ref, created_at, updated_at)
-               VALUES (:id, :namespace, :type, :name, :description,
-               :properties, :tags, :created_by, :visibility, :source_type,
-               :source_ref, :created_at, :updated_at)""",
-            _serialize_json_fields(node, ["properties", "tags"]),
+            _INSERT_NODE_SQL, _serialize_json_fields(node, ["properties", "tags"])
         )
         await self.db.commit()
         return node
 
+    async def insert_nodes(self, nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        try:
+            await self.db.executemany(
+                _INSERT_NODE_SQL,
+                [_serialize_json_fields(node, ["properties", "tags"]) for node in nodes],
+            )
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return nodes
+
     async def get_node(self, node_id: str) -> dict[str, Any] | None:
         cursor = await self.db.execute(
             "SELECT * FROM nodes WHERE id = ? AND deleted_at IS NULL", (node_id,)
@@ -138,11 +317,17 @@ class SQLiteStore(StorageBackend):
         row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
-    async def update_node(self, node_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
-        existing = await self.get_node(node_id)
-        if not existing:
-            return None
+    async def get_nodes(self, node_ids: list[str]) -> list[dict[str, Any]]:
+        cursor = await self.db.execute(
+            """SELECT nodes.* FROM json_each(?) AS ids
+               JOIN nodes ON nodes.id = ids.value
+               WHERE nodes.deleted_at IS NULL""",
+            (json.dumps(node_ids),),
+        )
+        rows = await cursor.fetchall()
+        return [_row_to_dict(row) for row in rows]
 
+    async def update_node(self, node_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
         updates = _validate_update_keys("nodes", updates)
         updates = _serialize_json_fields(updates, ["properties", "tags"])
         set_clauses = []
@@ -152,15 +337,15 @@ class SQLiteStore(StorageBackend):
             values.append(value)
 
         if not set_clauses:
-            return existing
+            return await self.get_node(node_id)
 
         values.append(node_id)
-        await self.db.execute(
-            f"UPDATE nodes SET {', '.join(set_clauses)} WHERE id = ?",
+        return await self._update_returning(
+            f"UPDATE nodes SET {', '.join(set_clauses)} WHERE id = ? AND deleted_at IS NULL",
             values,
+            self.get_node,
+            node_id,
         )
-        await self.db.commit()
-        return await self.get_node(node_id)
 
     async def soft_delete_node(self, node_id: str) -> bool:
         cursor = await self.db.execute(
@@ -170,6 +355,23 @@ class SQLiteStore(StorageBackend):
         await self.db.commit()
         return cursor.rowcount > 0
 
+    async def soft_delete_nodes(self, node_ids: list[str]) -> int:
+        deleted = 0
+        try:
+            for i in range(0, len(node_ids), _DELETE_BATCH_SIZE):
+                batch = node_ids[i : i + _DELETE_BATCH_SIZE]
+                cursor = await self.db.execute(
+                    f"""UPDATE nodes SET deleted_at = datetime('now')
+                        WHERE id IN ({", ".join("?" * len(batch))}) AND deleted_at IS NULL""",
+                    batch,
+                )
+                deleted += cursor.rowcount
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return deleted
+
     async def restore_node(self, node_id: str) -> bool:
         cursor = await self.db.execute(
             "UPDATE nodes SET deleted_at = NULL WHERE id = ? AND deleted_at IS NOT NULL",
@@ -261,16 +463,8 @@ class SQLiteStore(StorageBackend):
             conditions.append("nodes.visibility = ?")
             params.append(visibility)
 
-        where = " AND ".join(conditions)
-        query = f"""
-            SELECT nodes.*, rank FROM nodes_fts
-            JOIN nodes ON nodes.rowid = nodes_fts.rowid
-            WHERE nodes_fts MATCH ? AND {where}
-            ORDER BY rank
-            LIMIT ? OFFSET ?
-        """
         params.extend([limit, offset])
-        cursor = await self.db.execute(query, params)
+        cursor = await self.db.execute(_fts_search_sql("nodes", "nodes.*", conditions), params)
         rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
@@ -298,6 +492,21 @@ class SQLiteStore(StorageBackend):
         await self.db.commit()
         return edge
 
+    async def insert_edges(self, edges: list[dict[str, Any]]) -> int:
+        try:
+            cursor = await self.db.executemany(
+                """INSERT OR IGNORE INTO edges (source_id, target_id, type, weight,
+                   properties, created_by, created_at)
+                   VALUES (:source_id, :target_id, :type, :weight,
+                   :properties, :created_by, :created_at)""",
+                [_serialize_json_fields(edge, ["properties"]) for edge in edges],
+            )
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return cursor.rowcount
+
     async def get_edges(
         self,
         *,
@@ -323,6 +532,25 @@ class SQLiteStore(StorageBackend):
         rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
+    async def get_incident_edges(
+        self, node_ids: list[str], *, edge_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        # One UNION ALL branch per direction so each side uses its own index; ids are
+        # bound as a single JSON array, which sidesteps SQLite's host parameter limit.
+        type_filter = "AND edges.type = ?" if edge_type else ""
+        ids = json.dumps(node_ids)
+        params: list[Any] = [ids, edge_type, ids, edge_type] if edge_type else [ids, ids]
+        cursor = await self.db.execute(
+            f"""SELECT edges.* FROM json_each(?) AS ids
+                JOIN edges ON edges.source_id = ids.value {type_filter}
+                UNION ALL
+                SELECT edges.* FROM json_each(?) AS ids
+                JOIN edges ON edges.target_id = ids.value {type_filter}""",
+            params,
+        )
+        rows = await cursor.fetchall()
+        return [_row_to_dict(row) for row in rows]
+
     async def delete_edge(self, source_id: str, target_id: str, edge_type: str) -> bool:
         cursor = await self.db.execute(
             "DELETE FROM edges WHERE source_id = ? AND target_id = ? AND type = ?",
@@ -388,16 +616,26 @@ class SQLiteStore(StorageBackend):
         exp_type: str | None = None,
         text: str | None = None,
         min_score: float | None = None,
+        min_relevance: float | None = None,
+        order_by_relevance: bool = False,
         limit: int = 10,
         offset: int = 0,
+        content_max_len: int | None = None,
     ) -> list[dict[str, Any]]:
         if text:
             return await self._query_experiences_fts(
-                text, exp_type=exp_type, min_score=min_score, limit=limit, offset=offset
+                text,
+                exp_type=exp_type,
+                min_score=min_score,
+                min_relevance=min_relevance,
+                order_by_relevance=order_by_relevance,
+                limit=limit,
+                offset=offset,
+                content_max_len=content_max_len,
             )
 
         conditions: list[str] = []
-        params: list[Any] = []
+        params: list[Any] = [] if content_max_len is None else [content_max_len]
 
         if exp_type:
             conditions.append("type = ?")
@@ -405,11 +643,17 @@ class SQLiteStore(StorageBackend):
         if min_score is not None:
             conditions.append("score >= ?")
             params.append(min_score)
+        if min_relevance is not None:
+            conditions.append(f"{_relevance_sql()} >= ?")
+            params.append(min_relevance)
 
         where = " AND ".join(conditions) if conditions else "1=1"
+        order_by = (
+            f"{_relevance_sql()} DESC" if order_by_relevance else "score DESC, created_at DESC"
+        )
         query = f"""
-            SELECT * FROM experiences WHERE {where}
-            ORDER BY score DESC, created_at DESC
+            SELECT {_experience_projection(content_max_len)} FROM experiences WHERE {where}
+            ORDER BY {order_by}
             LIMIT ? OFFSET ?
         """
         params.extend([limit, offset])
@@ -423,11 +667,14 @@ class SQLiteStore(StorageBackend):
         *,
         exp_type: str | None = None,
         min_score: float | None = None,
+        min_relevance: float | None = None,
+        order_by_relevance: bool = False,
         limit: int = 10,
         offset: int = 0,
+        content_max_len: int | None = None,
     ) -> list[dict[str, Any]]:
         conditions: list[str] = []
-        params: list[Any] = [text]
+        params: list[Any] = [text] if content_max_len is None else [text, content_max_len]
 
         if exp_type:
             conditions.append("experiences.type = ?")
@@ -435,17 +682,18 @@ class SQLiteStore(StorageBackend):
         if min_score is not None:
             conditions.append("experiences.score >= ?")
             params.append(min_score)
+        if min_relevance is not None:
+            conditions.append(f"{_relevance_sql('experiences')} >= ?")
+            params.append(min_relevance)
 
-        extra_where = (" AND " + " AND ".join(conditions)) if conditions else ""
-        query = f"""
-            SELECT experiences.*, rank FROM experiences_fts
-            JOIN experiences ON experiences.rowid = experiences_fts.rowid
-            WHERE experiences_fts MATCH ?{extra_where}
-            ORDER BY rank
-            LIMIT ? OFFSET ?
-        """
+        projection = _experience_projection(content_max_len, table="experiences")
         params.extend([limit, offset])
-        cursor = await self.db.execute(query, params)
+        order_by = (
+            f"{_relevance_sql('experiences')} DESC" if order_by_relevance else "fts_matches.rank"
+        )
+        cursor = await self.db.execute(
+            _fts_search_sql("experiences", projection, conditions, order_by=order_by), params
+        )
         rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
@@ -459,6 +707,8 @@ class SQLiteStore(StorageBackend):
         await self.db.commit()
         if cursor.rowcount == 0:
             return None
+        # Re-read rather than RETURNING: RETURNING would miss the needs_promotion
+        # flag that the exp_auto_promote trigger sets after this UPDATE.
         return await self.get_experience(exp_id)
 
     async def delete_experience(self, exp_id: str) -> bool:
@@ -466,6 +716,22 @@ class SQLiteStore(StorageBackend):
         await self.db.commit()
         return cursor.rowcount > 0
 
+    async def delete_experiences(self, exp_ids: list[str]) -> int:
+        deleted = 0
+        try:
+            for i in range(0, len(exp_ids), _DELETE_BATCH_SIZE):
+                batch = exp_ids[i : i + _DELETE_BATCH_SIZE]
+                cursor = await self.db.execute(
+                    f"DELETE FROM experiences WHERE id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                deleted += cursor.rowcount
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return deleted
+
     async def get_promotable_experiences(self) -> list[dict[str, Any]]:
         cursor = await self.db.execute(
             """SELECT * FROM experiences
@@ -475,6 +741,15 @@ class SQLiteStore(StorageBackend):
         rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
+    async def get_expired_experiences(self, threshold: float) -> list[dict[str, Any]]:
+        cursor = await self.db.execute(
+            f"""SELECT id, {_relevance_sql()} AS relevance FROM experiences
+                WHERE {_relevance_sql()} < ?""",
+            (threshold,),
+        )
+        rows = await cursor.fetchall()
+        return [_row_to_dict(row) for row in rows]
+
     # --- Project operations ---
 
     async def insert_project(self, project: dict[str, Any]) -> dict[str, Any]:
@@ -496,10 +771,6 @@ class SQLiteStore(StorageBackend):
     async def update_project(
         self, project_id: str, updates: dict[str, Any]
     ) -> dict[str, Any] | None:
-        existing = await self.get_project(project_id)
-        if not existing:
-            return None
-
         updates = _validate_update_keys("projects", updates)
         updates = _serialize_json_fields(updates, ["goals", "stakeholders", "success_metrics"])
         set_clauses = []
@@ -510,50 +781,52 @@ class SQLiteStore(StorageBackend):
                 values.append(value)
 
         if not set_clauses:
-            return existing
+            return await self.get_project(project_id)
 
         values.append(project_id)
-        await self.db.execute(
+        return await self._update_returning(
             f"UPDATE projects SET {', '.join(set_clauses)} WHERE id = ?",
             values,
+            self.get_project,
+            project_id,
         )
-        await self.db.commit()
-        return await self.get_project(project_id)
 
     async def list_projects(self, *, active_only: bool = False) -> list[dict[str, Any]]:
-        if active_only:
-            cursor = await self.db.execute(
-                "SELECT * FROM projects WHERE active = 1 ORDER BY updated_at DESC"
-            )
-        else:
-            cursor = await self.db.execute(
-                "SELECT * FROM projects ORDER BY active DESC, updated_at DESC"
-            )
+        cursor = await self.db.execute(_list_projects_sql(active_only))
         rows = await cursor.fetchall()
         return [_row_to_dict(row) for row in rows]
 
     async def set_active_project(self, project_id: str) -> bool:
-        project = await self.get_project(project_id)
-        if not project:
-            return False
-        await self.db.execute("UPDATE projects SET active = 0")
-        await self.db.execute("UPDATE projects SET active = 1 WHERE id = ?", (project_id,))
+        cursor = await self.db.execute(_ACTIVATE_PROJECT_SQL, (project_id, project_id))
         await self.db.commit()
-        return True
+        return cursor.rowcount > 0
+
+    async def set_active_and_list_projects(
+        self, project_id: str, *, active_only: bool = False
+    ) -> tuple[bool, list[dict[str, Any]]]:
+        cursor = await self.db.execute(_ACTIVATE_PROJECT_SQL, (project_id, project_id))
+        found = cursor.rowcount > 0
+        cursor = await self.db.execute(_list_projects_sql(active_only))
+        rows = await cursor.fetchall()
+        await self.db.commit()
+        return found, [_row_to_dict(row) for row in rows]
 
     # --- Progress operations ---
 
     async def insert_progress(self, entry: dict[str, Any]) -> dict[str, Any]:
-        await self.db.execute(
-            """INSERT INTO progress (id, project_id, type, action, result, next_step,
-               created_by, created_at)
-               VALUES (:id, :project_id, :type, :action, :result, :next_step,
-               :created_by, :created_at)""",
-            entry,
-        )
+        await self.db.execute(_INSERT_PROGRESS_SQL, entry)
         await self.db.commit()
         return entry
 
+    async def insert_progress_many(self, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        try:
+            await self.db.executemany(_INSERT_PROGRESS_SQL, entries)
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return entries
+
     async def get_progress(
         self, project_id: str, *, entry_type: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
@@ -590,10 +863,6 @@ class SQLiteStore(StorageBackend):
         return _row_to_dict(row) if row else None
 
     async def update_idea(self, idea_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
-        existing = await self.get_idea(idea_id)
-        if not existing:
-            return None
-
         updates = _validate_update_keys("ideas", updates)
         updates = _serialize_json_fields(updates, ["properties"])
         set_clauses = []
@@ -603,15 +872,15 @@ class SQLiteStore(StorageBackend):
             values.append(value)
 
         if not set_clauses:
-            return existing
+            return await self.get_idea(idea_id)
 
         values.append(idea_id)
-        await self.db.execute(
+        return await self._update_returning(
             f"UPDATE ideas SET {', '.join(set_clauses)} WHERE id = ?",
             values,
+            self.get_idea,
+            idea_id,
         )
-        await self.db.commit()
-        return await self.get_idea(idea_id)
 
     async def list_ideas(
         self,
@@ -645,22 +914,47 @@ class SQLiteStore(StorageBackend):
     # --- Route operations ---
 
     async def upsert_route(self, keyword: str, node_ids: list[str], confidence: float) -> None:
-        await self.db.execute(
-            """INSERT INTO routes (keyword, node_ids, confidence)
-               VALUES (?, ?, ?)
-               ON CONFLICT(keyword) DO UPDATE SET node_ids = ?, confidence = ?""",
-            (keyword, json.dumps(node_ids), confidence, json.dumps(node_ids), confidence),
-        )
+        await self.upsert_routes([(keyword, node_ids, confidence)])
+
+    async def upsert_routes(self, routes: list[tuple[str, list[str], float]]) -> None:
+        try:
+            for keyword, node_ids, confidence in routes:
+                await self.db.execute(
+                    """INSERT INTO routes (keyword, confidence) VALUES (?, ?)
+                       ON CONFLICT(keyword) DO UPDATE SET confidence = excluded.confidence""",
+                    (keyword, confidence),
+                )
+                await self.db.execute("DELETE FROM route_nodes WHERE keyword = ?", (keyword,))
+                await self.db.executemany(
+                    "INSERT OR IGNORE INTO route_nodes (keyword, node_id, position) "
+                    "VALUES (?, ?, ?)",
+                    [(keyword, node_id, i) for i, node_id in enumerate(node_ids)],
+                )
+        except BaseException:
+            await self.db.rollback()
+            raise
         await self.db.commit()
 
     async def get_routes(self, keywords: list[str]) -> list[dict[str, Any]]:
-        placeholders = ",".join("?" * len(keywords))
-        cursor = await self.db.execute(
-            f"SELECT * FROM routes WHERE keyword IN ({placeholders})",
-            keywords,
-        )
-        rows = await cursor.fetchall()
-        return [_row_to_dict(row) for row in rows]
+        if not keywords:
+            return []
+        # Pad with NULLs (which never match) up to a power of two, so only a
+        # handful of distinct statements ever reach the statement cache.
+        slots = 1 << (len(keywords) - 1).bit_length()
+        params = [*keywords, *([None] * (slots - len(keywords)))]
+        cursor = await self.db.execute(_routes_sql(slots), params)
+        routes: dict[str, dict[str, Any]] = {}
+        for keyword, confidence, node_id in await cursor.fetchall():
+            route = routes.get(keyword)
+            if route is None:
+                route = routes[keyword] = {
+                    "keyword": keyword,
+                    "node_ids": [],
+                    "confidence": confidence,
+                }
+            if node_id is not None:
+                route["node_ids"].append(node_id)
+        return list(routes.values())
 
     # --- Activity log ---
 
@@ -729,16 +1023,23 @@ class SQLiteStore(StorageBackend):
 # --- Helpers ---
 
 
+@functools.lru_cache(maxsize=8)
 def _load_sql(filename: str) -> str:
-    """Load SQL file from the schema package."""
-    schema_dir = Path(__file__).parent.parent / "schema"
-    return (schema_dir / filename).read_text()
+    """Load SQL file from the schema package (read once per process)."""
+    return resources.files("kairn.schema").joinpath(filename).read_text()
+
+
+def _list_projects_sql(active_only: bool) -> str:
+    """SQL for listing projects, optionally only the active one."""
+    if active_only:
+        return "SELECT * FROM projects WHERE active = 1 ORDER BY updated_at DESC"
+    return "SELECT * FROM projects ORDER BY active DESC, updated_at DESC"
 
 
 def _row_to_dict(row: aiosqlite.Row) -> dict[str, Any]:
     """Convert an aiosqlite Row to a dict, deserializing JSON fields."""
     d = dict(row)
-    for key in ("properties", "tags", "goals", "stakeholders", "success_metrics", "node_ids"):
+    for key in ("properties", "tags", "goals", "stakeholders", "success_metrics"):
         if key in d and isinstance(d[key], str):
             try:
                 d[key] = json.loads(d[key])
@@ -7,6 +7,7 @@ import time
 
 import pytest
 
+import kairn.auth.jwt as jwt_module
 from kairn.auth.jwt import TokenExpiredError, TokenInvalidError, create_token, verify_token
 from kairn.auth.permissions import can_admin, can_read, can_write, check_permission
 
@@ -58,6 +59,78 @@ class TestJWT:
         with pytest.raises(TokenInvalidError):
             verify_token("not.a.valid.jwt", secret)
 
+    def test_refresh_secret(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("KAIRN_JWT_SECRET", "rotated-secret")
+        jwt_module.refresh_secret()
+        try:
+            token = create_token("user-123", "org-456")
+            assert verify_token(token, "rotated-secret")["sub"] == "user-123"
+        finally:
+            monkeypatch.undo()
+            jwt_module.refresh_secret()
+
+    def test_eddsa_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+        private_key = Ed25519PrivateKey.generate()
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        public_pem = (
+            private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            .decode()
+        )
+        monkeypatch.setenv("KAIRN_JWT_ALG", "EdDSA")
+        monkeypatch.setenv("KAIRN_JWT_PRIVATE_KEY", private_pem)
+        monkeypatch.setenv("KAIRN_JWT_PUBLIC_KEY", public_pem)
+        jwt_module.refresh_secret()
+        try:
+            token = create_token("user-123", "org-456")
+            assert jwt_module.verification_key() == public_pem
+            assert verify_token(token, public_pem)["sub"] == "user-123"
+            with pytest.raises(TokenInvalidError):
+                verify_token(token, "not-a-pem-key")
+        finally:
+            monkeypatch.undo()
+            jwt_module.refresh_secret()
+
+    def test_cached_token_still_checks_secret(self) -> None:
+        token = create_token("user-123", "org-456")
+        secret = os.environ.get("KAIRN_JWT_SECRET", "test-secret-key-do-not-use")
+        verify_token(token, secret)
+
+        with pytest.raises(TokenInvalidError):
+            verify_token(token, "wrong-secret")
+
+    def test_cached_token_redecoded_after_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        decode_calls = 0
+        real_decode = jwt_module.jwt.decode
+
+        def counting_decode(*args: object, **kwargs: object) -> dict[str, object]:
+            nonlocal decode_calls
+            decode_calls += 1
+            return real_decode(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(jwt_module.jwt, "decode", counting_decode)
+        token = create_token("user-cache", "org-456", exp_minutes=1)
+        secret = os.environ.get("KAIRN_JWT_SECRET", "test-secret-key-do-not-use")
+
+        verify_token(token, secret)
+        verify_token(token, secret)
+        assert decode_calls == 1
+
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        verify_token(token, secret)
+        assert decode_calls == 2
+
 
 class TestPermissions:
     """Test RBAC permission checks."""
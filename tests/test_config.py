@@ -0,0 +1,43 @@
+"""Tests for configuration loading."""
+
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+
+import kairn.config as config_module
+from kairn.config import Config
+
+
+def test_decay_tables(config: Config):
+    assert config.decay_rate_for_type("pattern") == math.log(2) / 300.0
+    assert config.decay_rate_for_type("unknown") == math.log(2) / 200.0
+    assert config.confidence_multiplier("low") == 4.0
+    assert config.confidence_multiplier("unknown") == 1.0
+
+
+def test_decay_tables_follow_yaml_overrides(tmp_path: Path):
+    (tmp_path / "config.yaml").write_text("decay_gotcha: 10\nconfidence_multiplier_low: 8\n")
+
+    config = Config.load(tmp_path)
+
+    assert config.decay_rate_for_type("gotcha") == math.log(2) / 10.0
+    assert config.confidence_multiplier("low") == 8.0
+
+
+def test_load_caches_parsed_yaml(tmp_path: Path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("pagination_default: 20\n")
+    config_module._read_config_file.cache_clear()
+
+    assert Config.load(tmp_path).pagination_default == 20
+    assert Config.load(tmp_path).pagination_default == 20
+    assert config_module._read_config_file.cache_info().hits == 1
+
+    config_file.write_text("pagination_default: 30\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert Config.load(tmp_path).pagination_default == 30
+    assert config_module._read_config_file.cache_info().misses == 2
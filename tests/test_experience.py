@@ -13,7 +13,7 @@ from kairn.core.experience import (
 )
 from kairn.events.bus import EventBus
 from kairn.events.types import EventType
-from kairn.models.experience import VALID_CONFIDENCES, VALID_TYPES
+from kairn.models.experience import VALID_CONFIDENCES, VALID_TYPES, Experience
 
 
 @pytest.fixture
@@ -155,6 +155,20 @@ async def test_decay_math_half_life_high_confidence(engine):
     assert abs(relevance - 0.5) < 0.01
 
 
+def test_relevance_accepts_timestamp():
+    """Test that relevance gives the same value for a datetime or POSIX timestamp."""
+    now = datetime.now(timezone.utc)
+    exp = Experience(
+        type="solution",
+        content="Test",
+        decay_rate=0.01,
+        created_at=(now - timedelta(days=50)).replace(tzinfo=None).isoformat(),
+    )
+
+    assert exp.relevance(at=now.timestamp()) == pytest.approx(exp.relevance(at=now))
+    assert exp.relevance(at=now) == pytest.approx(math.exp(-0.5))
+
+
 @pytest.mark.asyncio
 async def test_decay_math_low_confidence_4x_faster(engine):
     """Test that low confidence decays 4x faster than high."""
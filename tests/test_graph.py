@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 import pytest
 
 from kairn.core.graph import GraphEngine
@@ -168,6 +170,23 @@ async def test_auto_link_on_add(graph: GraphEngine):
     assert any(e.target_id == n1.id for e in auto_edges)
 
 
+async def test_auto_link_query_is_deduplicated_and_capped(
+    graph: GraphEngine, monkeypatch: pytest.MonkeyPatch
+):
+    queries: list[str] = []
+    original = graph.store.query_nodes
+
+    async def spy(**kwargs):
+        queries.append(kwargs["text"])
+        return await original(**kwargs)
+
+    monkeypatch.setattr(graph.store, "query_nodes", spy)
+    words = [f"word{i}" for i in range(12)]
+    await graph.add_node(name="Redis redis", type="concept", description=" ".join(words))
+
+    assert queries == [" OR ".join(["redis", *words[:7]])]
+
+
 async def test_stats(graph: GraphEngine):
     await graph.add_node(name="Test", type="concept")
     stats = await graph.stats()
@@ -190,3 +209,41 @@ async def test_events_emitted(store: SQLiteStore):
 
     await graph.remove_node(node.id)
     assert any(e[0] == EventType.NODE_DELETED for e in events)
+
+
+async def test_add_nodes_bulk(store: SQLiteStore):
+    bus = EventBus()
+    events: list = []
+
+    async def collect(et, data):
+        events.append((et, data))
+
+    bus.on_all(collect)
+    graph = GraphEngine(store, bus)
+
+    nodes = await graph.add_nodes_bulk(
+        [{"name": f"Bulk {i}", "type": "concept", "tags": ["bulk"]} for i in range(5)]
+    )
+
+    assert len(nodes) == 5
+    fetched = await graph.get_node(nodes[3].id)
+    assert fetched is not None
+    assert fetched.name == "Bulk 3"
+    assert fetched.tags == ["bulk"]
+    assert [e[1]["node_id"] for e in events if e[0] == EventType.NODE_CREATED] == [
+        n.id for n in nodes
+    ]
+
+
+async def test_add_nodes_bulk_is_atomic(graph: GraphEngine):
+    existing = await graph.add_node(name="Existing", type="concept")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        await graph.add_nodes_bulk(
+            [
+                {"name": "Fresh", "type": "concept"},
+                {"id": existing.id, "name": "Clash", "type": "concept"},
+            ]
+        )
+
+    assert len(await graph.query(node_type="concept", limit=10)) == 1
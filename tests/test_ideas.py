@@ -125,6 +125,17 @@ async def test_update_idea_properties(engine):
     assert updated.properties == {"b": 2}
 
 
+@pytest.mark.asyncio
+async def test_update_idea_sets_iso_updated_at(engine):
+    """Test that updated_at is stored as an ISO-8601 string."""
+    idea = await engine.create(title="Timestamp Test")
+    updated = await engine.update(idea.id, title="Changed")
+
+    assert updated is not None
+    assert isinstance(updated.updated_at, str)
+    assert "T" in updated.updated_at
+
+
 @pytest.mark.asyncio
 async def test_update_idea_emits_event(engine):
     """Test that updating idea emits IDEA_UPDATED event."""
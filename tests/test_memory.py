@@ -310,6 +310,37 @@ async def test_set_active_project_emits_event(memory, event_bus):
     assert events[0]["data"]["project_id"] == project.id
 
 
+@pytest.mark.asyncio
+async def test_set_active_and_list(memory):
+    """Test activating a project and listing in one call."""
+    p1 = await memory.create_project(name="Project 1")
+    p2 = await memory.create_project(name="Project 2")
+    await memory.set_active_project(p1.id)
+
+    ok, projects = await memory.set_active_and_list(p2.id)
+
+    assert ok is True
+    assert len(projects) == 2
+    active = {p.id: p.active for p in projects}
+    assert active == {p1.id: False, p2.id: True}
+
+    ok, projects = await memory.set_active_and_list(p1.id, active_only=True)
+    assert ok is True
+    assert [p.id for p in projects] == [p1.id]
+
+
+@pytest.mark.asyncio
+async def test_set_active_and_list_not_found(memory):
+    """Test that an unknown project leaves the active flag untouched."""
+    project = await memory.create_project(name="Keep Active")
+    await memory.set_active_project(project.id)
+
+    ok, projects = await memory.set_active_and_list("non-existent-id")
+
+    assert ok is False
+    assert [p.active for p in projects] == [True]
+
+
 @pytest.mark.asyncio
 async def test_log_progress_minimal(memory):
     """Test logging progress with minimal fields."""
@@ -401,6 +432,35 @@ async def test_log_failure_emits_event(memory, event_bus):
     assert events[0]["data"]["type"] == "failure"
 
 
+@pytest.mark.asyncio
+async def test_log_progress_bulk(memory, event_bus):
+    """Test logging many entries at once stores them all and emits one batch event."""
+    events = []
+
+    async def capture_event(event_type, data):
+        events.append((event_type, data))
+
+    event_bus.on_all(capture_event)
+
+    project = await memory.create_project(name="Bulk Test")
+    logged = await memory.log_progress_bulk(
+        project.id,
+        [
+            {"action": "Step 1", "result": "ok"},
+            {"action": "Step 2", "type": "failure", "next_step": "retry"},
+        ],
+    )
+
+    assert [e.type for e in logged] == ["progress", "failure"]
+    assert events[-1] == (
+        EventType.PROGRESS_LOGGED_BATCH,
+        {"project_id": project.id, "count": 2, "types": {"progress": 1, "failure": 1}},
+    )
+    assert not any(event_type == EventType.PROGRESS_LOGGED for event_type, _ in events)
+    stored = await memory.get_progress(project.id, limit=10)
+    assert {e.action for e in stored} == {"Step 1", "Step 2"}
+
+
 @pytest.mark.asyncio
 async def test_get_progress_all_entries(memory):
     """Test getting all progress entries for a project."""
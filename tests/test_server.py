@@ -7,7 +7,8 @@ import json
 import pytest
 from fastmcp import Client
 
-from kairn.server import create_server
+import kairn.server as server_module
+from kairn.server import create_server, list_tool_specs
 
 
 def _text(result) -> str:
@@ -47,6 +48,22 @@ async def test_tool_descriptions_short(client: Client):
         assert len(tool.description) <= 100, f"{tool.name} description too long"
 
 
+async def test_list_tool_specs_matches_client(client: Client, tmp_path):
+    specs = await list_tool_specs(str(tmp_path / "test.db"))
+    listed = await client.list_tools()
+    assert [(t.name, t.description, t.inputSchema) for t in specs] == [
+        (t.name, t.description, t.inputSchema) for t in listed
+    ]
+
+
+def test_json_output_does_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch):
+    data = {"_v": "1.0", "name": "Café \"auth\"", "items": [1, 2.5, None, True]}
+    with_extra = server_module._json(data)
+    monkeypatch.setattr(server_module, "_orjson_dumps", None)
+    assert server_module._json(data) == with_extra
+    assert json.loads(with_extra) == data
+
+
 async def test_kn_add_node(client: Client):
     result = await client.call_tool("kn_add", {
         "name": "JWT Auth",
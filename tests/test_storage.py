@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import math
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
+import kairn.storage.sqlite_store as sqlite_store_module
+from kairn.models.experience import Experience
 from kairn.storage.sqlite_store import SQLiteStore
 
 
@@ -31,6 +35,16 @@ async def test_initialize_wal_mode(store: SQLiteStore):
     assert row[0] == "wal"
 
 
+@pytest.mark.parametrize(
+    ("pragma", "expected"),
+    [("synchronous", 1), ("temp_store", 2), ("cache_size", -64000), ("busy_timeout", 5000)],
+)
+async def test_initialize_connection_pragmas(store: SQLiteStore, pragma: str, expected: int):
+    cursor = await store.db.execute(f"PRAGMA {pragma}")
+    row = await cursor.fetchone()
+    assert row[0] == expected
+
+
 async def test_initialize_foreign_keys(store: SQLiteStore):
     cursor = await store.db.execute("PRAGMA foreign_keys")
     row = await cursor.fetchone()
@@ -105,6 +119,38 @@ async def test_update_nonexistent_node(store: SQLiteStore):
     assert result is None
 
 
+@pytest.mark.parametrize("has_returning", [True, False])
+async def test_update_node_returns_row(
+    store: SQLiteStore, monkeypatch: pytest.MonkeyPatch, has_returning: bool
+):
+    monkeypatch.setattr(sqlite_store_module, "_HAS_RETURNING", has_returning)
+    for nid in ("n1", "n2"):
+        await store.insert_node({
+            "id": nid,
+            "namespace": "knowledge",
+            "type": "concept",
+            "name": "Original",
+            "description": None,
+            "properties": None,
+            "tags": None,
+            "created_by": None,
+            "visibility": "workspace",
+            "source_type": None,
+            "source_ref": None,
+            "created_at": _now(),
+            "updated_at": None,
+        })
+    await store.soft_delete_node("n2")
+
+    updated = await store.update_node("n1", {"tags": ["a", "b"]})
+    assert updated is not None
+    assert updated["tags"] == ["a", "b"]
+    assert await store.update_node("n2", {"name": "Updated"}) is None
+    assert await store.update_node("nope", {"name": "Updated"}) is None
+    await store.restore_node("n2")
+    assert (await store.get_node("n2"))["name"] == "Original"
+
+
 async def test_soft_delete_and_restore_node(store: SQLiteStore):
     node = {
         "id": "n1",
@@ -136,6 +182,57 @@ async def test_soft_delete_nonexistent(store: SQLiteStore):
     assert await store.soft_delete_node("nope") is False
 
 
+async def test_get_nodes(store: SQLiteStore):
+    for nid in ("n1", "n2", "n3"):
+        await store.insert_node({
+            "id": nid,
+            "namespace": "knowledge",
+            "type": "concept",
+            "name": f"Node {nid}",
+            "description": None,
+            "properties": None,
+            "tags": None,
+            "created_by": None,
+            "visibility": "workspace",
+            "source_type": None,
+            "source_ref": None,
+            "created_at": _now(),
+            "updated_at": None,
+        })
+    await store.soft_delete_node("n2")
+
+    nodes = await store.get_nodes(["n1", "n2", "n3", "missing"])
+    assert sorted(n["id"] for n in nodes) == ["n1", "n3"]
+    assert await store.get_nodes([]) == []
+
+
+async def test_soft_delete_nodes_batches(store: SQLiteStore, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sqlite_store_module, "_DELETE_BATCH_SIZE", 2)
+    for i in range(5):
+        await store.insert_node(
+            {
+                "id": f"n{i}",
+                "namespace": "knowledge",
+                "type": "concept",
+                "name": f"Node {i}",
+                "description": None,
+                "properties": None,
+                "tags": None,
+                "created_by": None,
+                "visibility": "workspace",
+                "source_type": None,
+                "source_ref": None,
+                "created_at": _now(),
+                "updated_at": None,
+            }
+        )
+    await store.soft_delete_node("n0")
+
+    assert await store.soft_delete_nodes(["n0", "n1", "n2", "n3", "nope"]) == 3
+    assert await store.count_nodes() == 1
+    assert await store.get_node("n4") is not None
+
+
 # --- Node queries ---
 
 
@@ -433,6 +530,100 @@ async def test_insert_and_get_edges(store: SQLiteStore):
     assert len(edges) == 1
 
 
+async def test_insert_edges_skips_existing(store: SQLiteStore):
+    for nid in ("n1", "n2", "n3"):
+        await store.insert_node({
+            "id": nid,
+            "namespace": "knowledge",
+            "type": "concept",
+            "name": f"Node {nid}",
+            "description": None,
+            "properties": None,
+            "tags": None,
+            "created_by": None,
+            "visibility": "workspace",
+            "source_type": None,
+            "source_ref": None,
+            "created_at": _now(),
+            "updated_at": None,
+        })
+    edges = [
+        {
+            "source_id": "n1",
+            "target_id": target,
+            "type": "auto_related",
+            "weight": 0.5,
+            "properties": {"auto": True},
+            "created_by": None,
+            "created_at": _now(),
+        }
+        for target in ("n2", "n3")
+    ]
+
+    assert await store.insert_edges(edges[:1]) == 1
+    assert await store.insert_edges(edges) == 1
+    stored = await store.get_edges(source_id="n1")
+    assert sorted(e["target_id"] for e in stored) == ["n2", "n3"]
+    assert stored[0]["properties"] == {"auto": True}
+
+
+async def test_get_incident_edges(store: SQLiteStore):
+    for nid in ("n1", "n2", "n3", "n4"):
+        await store.insert_node({
+            "id": nid,
+            "namespace": "knowledge",
+            "type": "concept",
+            "name": f"Node {nid}",
+            "description": None,
+            "properties": None,
+            "tags": None,
+            "created_by": None,
+            "visibility": "workspace",
+            "source_type": None,
+            "source_ref": None,
+            "created_at": _now(),
+            "updated_at": None,
+        })
+    for source, target, edge_type in (
+        ("n1", "n2", "related_to"),
+        ("n3", "n1", "depends_on"),
+        ("n3", "n4", "related_to"),
+    ):
+        await store.insert_edge({
+            "source_id": source,
+            "target_id": target,
+            "type": edge_type,
+            "weight": 1.0,
+            "properties": None,
+            "created_by": None,
+            "created_at": _now(),
+        })
+
+    edges = await store.get_incident_edges(["n1"])
+    assert {(e["source_id"], e["target_id"]) for e in edges} == {("n1", "n2"), ("n3", "n1")}
+
+    edges = await store.get_incident_edges(["n1"], edge_type="related_to")
+    assert [(e["source_id"], e["target_id"]) for e in edges] == [("n1", "n2")]
+
+    edges = await store.get_incident_edges(["n2", "n4"])
+    assert {(e["source_id"], e["target_id"]) for e in edges} == {("n1", "n2"), ("n3", "n4")}
+    assert await store.get_incident_edges([]) == []
+
+
+async def test_edge_lookups_use_primary_key(store: SQLiteStore):
+    cursor = await store.db.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM edges WHERE source_id = ? AND target_id = ? AND type = ?",
+        ("n1", "n2", "related_to"),
+    )
+    plan = " ".join(row[3] for row in await cursor.fetchall())
+    assert "sqlite_autoindex_edges_1" in plan
+
+    cursor = await store.db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_edges_source'"
+    )
+    assert await cursor.fetchone() is None
+
+
 async def test_delete_edge(store: SQLiteStore):
     for nid in ("n1", "n2"):
         await store.insert_node({
@@ -536,6 +727,95 @@ async def test_experience_fts5(store: SQLiteStore):
     assert results[0]["id"] == "e2"
 
 
+async def test_query_experiences_content_max_len(store: SQLiteStore):
+    await store.insert_experience({
+        "id": "e1",
+        "type": "solution",
+        "content": "Redis caching " + "x" * 500,
+        "context": None,
+        "confidence": "high",
+        "score": 1.0,
+        "decay_rate": 0.00347,
+        "tags": None,
+        "properties": None,
+        "created_by": None,
+        "access_count": 0,
+        "promoted_to_node_id": None,
+        "created_at": _now(),
+        "last_accessed": None,
+    })
+
+    results = await store.query_experiences(content_max_len=20)
+    assert len(results) == 1
+    assert results[0]["content"] == "Redis caching xxxxxx"
+    assert results[0]["decay_rate"] == 0.00347
+
+    results = await store.query_experiences(text="Redis", content_max_len=5)
+    assert len(results) == 1
+    assert results[0]["content"] == "Redis"
+
+
+async def test_query_experiences_by_relevance(store: SQLiteStore):
+    now = datetime.now(timezone.utc)
+    for exp_id, days in (("old", 300), ("new", 0), ("mid", 100)):
+        await store.insert_experience({
+            "id": exp_id,
+            "type": "solution",
+            "content": f"Redis caching {exp_id}",
+            "context": None,
+            "confidence": "high",
+            "score": 1.0,
+            "decay_rate": 0.00347,
+            "tags": None,
+            "properties": None,
+            "created_by": None,
+            "access_count": 0,
+            "promoted_to_node_id": None,
+            "created_at": (now - timedelta(days=days)).isoformat(),
+            "last_accessed": None,
+        })
+
+    for text in (None, "Redis"):
+        results = await store.query_experiences(text=text, order_by_relevance=True)
+        assert [r["id"] for r in results] == ["new", "mid", "old"]
+
+        results = await store.query_experiences(
+            text=text, min_relevance=0.5, order_by_relevance=True
+        )
+        assert [r["id"] for r in results] == ["new", "mid"]
+        assert all(Experience(**r).relevance(at=now) >= 0.5 for r in results)
+
+        results = await store.query_experiences(
+            text=text, order_by_relevance=True, limit=1, offset=1
+        )
+        assert [r["id"] for r in results] == ["mid"]
+
+
+async def test_get_expired_experiences(store: SQLiteStore):
+    now = datetime.now(timezone.utc)
+    for exp_id, days in (("fresh", 0), ("stale", 2000)):
+        await store.insert_experience({
+            "id": exp_id,
+            "type": "solution",
+            "content": "Redis caching",
+            "context": None,
+            "confidence": "high",
+            "score": 1.0,
+            "decay_rate": 0.00347,
+            "tags": None,
+            "properties": None,
+            "created_by": None,
+            "access_count": 0,
+            "promoted_to_node_id": None,
+            "created_at": (now - timedelta(days=days)).isoformat(),
+            "last_accessed": None,
+        })
+
+    expired = await store.get_expired_experiences(0.01)
+    assert [row["id"] for row in expired] == ["stale"]
+    assert expired[0]["relevance"] == pytest.approx(math.exp(-0.00347 * 2000), rel=1e-3)
+
+
 async def test_increment_access_count(store: SQLiteStore):
     await store.insert_experience({
         "id": "e1",
@@ -623,6 +903,30 @@ async def test_delete_experience(store: SQLiteStore):
     assert await store.delete_experience("e1") is False
 
 
+async def test_delete_experiences_batches(store: SQLiteStore, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sqlite_store_module, "_DELETE_BATCH_SIZE", 2)
+    for i in range(5):
+        await store.insert_experience({
+            "id": f"e{i}",
+            "type": "solution",
+            "content": f"Deletable {i}",
+            "context": None,
+            "confidence": "high",
+            "score": 1.0,
+            "decay_rate": 0.00347,
+            "tags": None,
+            "properties": None,
+            "created_by": None,
+            "access_count": 0,
+            "promoted_to_node_id": None,
+            "created_at": _now(),
+            "last_accessed": None,
+        })
+
+    assert await store.delete_experiences(["e0", "e1", "e2", "nope"]) == 3
+    assert {r["id"] for r in await store.query_experiences()} == {"e3", "e4"}
+
+
 # --- Project operations ---
 
 
@@ -777,6 +1081,84 @@ async def test_route_upsert_and_get(store: SQLiteStore):
     assert "n4" in routes[0]["node_ids"]
 
 
+async def test_get_routes_batched(store: SQLiteStore):
+    for kw in ("auth", "caching", "redis"):
+        await store.upsert_route(kw, ["n1"], 0.5)
+
+    routes = await store.get_routes(["auth", "caching", "redis", "missing", "other"])
+    assert sorted(r["keyword"] for r in routes) == ["auth", "caching", "redis"]
+    assert await store.get_routes([]) == []
+
+
+async def test_upsert_routes_is_atomic(store: SQLiteStore):
+    await store.upsert_routes([("auth", ["n1"], 0.9), ("caching", ["n2", "n1"], 0.5)])
+    routes = {r["keyword"]: r for r in await store.get_routes(["auth", "caching"])}
+    assert routes["caching"]["node_ids"] == ["n2", "n1"]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        await store.upsert_routes([("auth", ["n1", "n3"], 0.9), ("broken", ["n1"], None)])
+    routes = {r["keyword"]: r for r in await store.get_routes(["auth", "broken"])}
+    assert list(routes) == ["auth"]
+    assert routes["auth"]["node_ids"] == ["n1"]
+
+
+async def test_route_node_order_preserved(store: SQLiteStore):
+    await store.upsert_route("auth", ["n3", "n1", "n2"], 0.9)
+
+    routes = await store.get_routes(["auth"])
+    assert routes[0]["node_ids"] == ["n3", "n1", "n2"]
+
+
+async def test_migrates_legacy_route_node_ids(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE routes (keyword TEXT NOT NULL PRIMARY KEY, "
+        "node_ids JSON NOT NULL, confidence REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO routes VALUES ('auth', '[\"n1\", \"n2\"]', 0.8)")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(db_path)
+    await store.initialize()
+    try:
+        routes = await store.get_routes(["auth"])
+        assert routes == [{"keyword": "auth", "node_ids": ["n1", "n2"], "confidence": 0.8}]
+        cursor = await store.db.execute("SELECT name FROM pragma_table_info('routes')")
+        assert "node_ids" not in {row[0] for row in await cursor.fetchall()}
+    finally:
+        await store.close()
+
+
+async def test_failed_route_migration_keeps_legacy_routes(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE routes (keyword TEXT NOT NULL PRIMARY KEY, "
+        "node_ids JSON NOT NULL, confidence REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO routes VALUES ('auth', '[\"n1\"]', 0.8)")
+    # Collides with the migration's scratch table, so it fails midway
+    conn.execute("CREATE TABLE routes_migrated (keyword TEXT)")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(db_path)
+    with pytest.raises(sqlite3.OperationalError):
+        await store.initialize()
+    await store.close()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT keyword, node_ids FROM routes").fetchall() == [
+            ("auth", '["n1"]')
+        ]
+        assert conn.execute("SELECT COUNT(*) FROM route_nodes").fetchone() == (0,)
+    finally:
+        conn.close()
+
+
 # --- Activity log ---
 
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
 from collections.abc import AsyncGenerator
+from datetime import datetime
 from pathlib import Path
 
 import aiosqlite
 import pytest
 
+import kairn.storage.metadata_store as metadata_store_module
 from kairn.storage.metadata_store import MetadataStore
 
 
@@ -57,6 +61,16 @@ class TestUserCRUD:
         assert updated["name"] == "Updated Name"
         assert updated["email"] == "test@example.com"
 
+    async def test_update_user_not_found(self, metadata_store: MetadataStore) -> None:
+        assert await metadata_store.update_user("nonexistent", {"name": "X"}) is None
+
+    async def test_update_user_ignores_unknown_fields(self, metadata_store: MetadataStore) -> None:
+        await metadata_store.create_user("user-1", "test@example.com", "Test User")
+        updated = await metadata_store.update_user("user-1", {"email": "evil@example.com"})
+
+        assert updated is not None
+        assert updated["email"] == "test@example.com"
+
     async def test_list_users(self, metadata_store: MetadataStore) -> None:
         await metadata_store.create_user("user-1", "u1@example.com", "User One")
         await metadata_store.create_user("user-2", "u2@example.com", "User Two")
@@ -66,6 +80,23 @@ class TestUserCRUD:
         assert any(u["user_id"] == "user-1" for u in users)
         assert any(u["user_id"] == "user-2" for u in users)
 
+    async def test_list_users_paginates(self, metadata_store: MetadataStore) -> None:
+        for i in range(3):
+            await metadata_store.create_user(f"user-{i}", f"u{i}@example.com", f"User {i}")
+
+        first = await metadata_store.list_users(limit=2)
+        rest = await metadata_store.list_users(limit=2, offset=2)
+
+        assert [u["user_id"] for u in first] == ["user-2", "user-1"]
+        assert [u["user_id"] for u in rest] == ["user-0"]
+
+    async def test_created_at_is_fixed_width_iso(self, metadata_store: MetadataStore) -> None:
+        user = await metadata_store.create_user("user-1", "test@example.com", "Test User")
+
+        created = datetime.fromisoformat(user["created_at"])
+        assert created.tzinfo is not None
+        assert len(user["created_at"]) == len("2024-01-01T00:00:00.000000+00:00")
+
     async def test_duplicate_email(self, metadata_store: MetadataStore) -> None:
         await metadata_store.create_user("user-1", "test@example.com", "User One")
 
@@ -140,6 +171,18 @@ class TestWorkspaceCRUD:
         workspace = await metadata_store.get_workspace("ws-1")
         assert workspace is not None
         assert workspace["workspace_id"] == "ws-1"
+        assert set(workspace) == {
+            "workspace_id",
+            "org_id",
+            "name",
+            "description",
+            "created_at",
+            "created_by",
+            "visibility",
+            "workspace_type",
+            "repo_url",
+            "tech_stack",
+        }
 
     async def test_list_workspaces(self, metadata_store: MetadataStore) -> None:
         await metadata_store.create_user("user-1", "test@example.com", "Test User")
@@ -183,6 +226,29 @@ class TestWorkspaceMembers:
         assert member["user_id"] == "user-2"
         assert member["role"] == "contributor"
 
+    async def test_add_members(self, metadata_store: MetadataStore) -> None:
+        await metadata_store.create_user("user-1", "u1@example.com", "User One")
+        await metadata_store.create_user("user-2", "u2@example.com", "User Two")
+        await metadata_store.create_org("org-1", "Test Org", "user-1")
+        await metadata_store.create_workspace("ws-1", "org-1", "Test Workspace", "user-1")
+
+        added = await metadata_store.add_members(
+            "ws-1", [("user-1", "owner"), ("user-2", "reader")]
+        )
+        assert [m["role"] for m in added] == ["owner", "reader"]
+        assert len(await metadata_store.get_members("ws-1")) == 2
+
+    async def test_add_members_is_atomic(self, metadata_store: MetadataStore) -> None:
+        await metadata_store.create_user("user-1", "u1@example.com", "User One")
+        await metadata_store.create_org("org-1", "Test Org", "user-1")
+        await metadata_store.create_workspace("ws-1", "org-1", "Test Workspace", "user-1")
+
+        with pytest.raises(aiosqlite.IntegrityError):
+            await metadata_store.add_members(
+                "ws-1", [("user-1", "owner"), ("missing-user", "reader")]
+            )
+        assert await metadata_store.get_members("ws-1") == []
+
     async def test_get_members(self, metadata_store: MetadataStore) -> None:
         await metadata_store.create_user("user-1", "u1@example.com", "User One")
         await metadata_store.create_user("user-2", "u2@example.com", "User Two")
@@ -227,6 +293,19 @@ class TestWorkspaceMembers:
         members = await metadata_store.get_members("ws-1")
         assert not any(m["user_id"] == "user-2" for m in members)
 
+    async def test_membership_lookup_by_user_uses_index(
+        self, metadata_store: MetadataStore
+    ) -> None:
+        async with metadata_store._read() as conn:
+            cursor = await conn.execute(
+                """EXPLAIN QUERY PLAN SELECT w.* FROM workspaces w
+                   JOIN workspace_members wm ON w.workspace_id = wm.workspace_id
+                   WHERE wm.user_id = ?""",
+                ("user-1",),
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_wm_user_ws" in plan
+
 
 class TestWorkspaceIsolation:
     """Test that knowledge in one workspace is not visible in another."""
@@ -267,3 +346,86 @@ class TestWorkspaceIsolation:
 
         assert len(user2_workspaces) == 1
         assert user2_workspaces[0]["workspace_id"] == "ws-b"
+
+
+class TestConnectionPool:
+    """Test pooled connections behind the metadata store."""
+
+    async def test_concurrent_reads(self, metadata_store: MetadataStore) -> None:
+        await metadata_store.create_user("user-1", "test@example.com", "Test User")
+
+        users = await asyncio.gather(*(metadata_store.get_user("user-1") for _ in range(10)))
+
+        assert all(u is not None and u["email"] == "test@example.com" for u in users)
+        readers = metadata_store._readers
+        assert readers is not None
+        assert len(readers._connections) <= readers.size
+
+    async def test_in_memory_store_reads_its_writes(self) -> None:
+        store = MetadataStore(Path(":memory:"))
+        await store.initialize()
+        try:
+            await store.create_user("user-1", "test@example.com", "Test User")
+            user = await store.get_user("user-1")
+            assert user is not None
+            assert user["email"] == "test@example.com"
+        finally:
+            await store.close()
+
+    async def test_in_memory_store_under_concurrency(self) -> None:
+        store = MetadataStore(Path(":memory:"))
+        await store.initialize()
+        try:
+            await asyncio.gather(
+                *(store.create_user(f"user-{i}", f"u{i}@ex.com", f"User {i}") for i in range(5))
+            )
+            users = await asyncio.gather(*(store.get_user(f"user-{i}") for i in range(5)))
+            assert all(user is not None for user in users)
+            assert store._readers is store._writer
+            assert len(store._writer._connections) == 1
+        finally:
+            await store.close()
+
+    async def test_failed_write_releases_connection(self, metadata_store: MetadataStore) -> None:
+        await metadata_store.create_user("user-1", "test@example.com", "User One")
+        with pytest.raises(aiosqlite.IntegrityError):
+            await metadata_store.create_user("user-2", "test@example.com", "User Two")
+
+        async with metadata_store._write() as conn:
+            assert not conn.in_transaction
+        await metadata_store.create_user("user-3", "other@example.com", "User Three")
+        assert len(await metadata_store.list_users()) == 2
+
+    async def test_connection_pragmas(self, metadata_store: MetadataStore) -> None:
+        async with metadata_store._read() as conn:
+            cursor = await conn.execute("PRAGMA journal_mode")
+            assert (await cursor.fetchone())[0] == "wal"
+            cursor = await conn.execute("PRAGMA busy_timeout")
+            assert (await cursor.fetchone())[0] == 30000
+            cursor = await conn.execute("PRAGMA synchronous")
+            assert (await cursor.fetchone())[0] == 1
+
+    async def test_readers_are_query_only(self, metadata_store: MetadataStore) -> None:
+        async with metadata_store._read() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("DELETE FROM users")
+
+    async def test_periodic_optimize(
+        self, metadata_store: MetadataStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(metadata_store_module, "_OPTIMIZE_EVERY_WRITES", 2)
+        statements: list[str] = []
+        async with metadata_store._write() as conn:  # schema apply was write 1; this is 2
+            execute = conn.execute
+
+            def spy(sql: str, *args: object) -> object:
+                statements.append(sql)
+                return execute(sql, *args)
+
+            monkeypatch.setattr(conn, "execute", spy)
+
+        for i in range(1, 4):  # writes 3, 4 and 5
+            await metadata_store.create_user(f"user-{i}", f"u{i}@example.com", f"User {i}")
+
+        assert statements.count("PRAGMA optimize") == 2  # after writes 2 and 4
+        assert len(await metadata_store.list_users()) == 3